@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from manim import (
     Scene,
@@ -29,6 +30,12 @@ from manim import (
     Arrow,
 )
 
+from DescriptiveStats import RunningStats
+from GlyphCache import cached_text
+from HistMobjects import LiveHistogram
+from TableMobjects import DataTable
+from TablePreview import TablePreview
+
 
 class DataToHist01(Scene):
     def construct(self):
@@ -68,28 +75,28 @@ class DataToHist01(Scene):
         # ======================================================
         column_widths = [1, 2, 2]  # widths for each column
         y_spacing = 0.75  # vertical spacing between rows
-        x_positions = [
-            sum(column_widths[:j]) + column_widths[j] / 2 - sum(column_widths) / 2
-            for j in range(len(column_widths))
-        ]
+        table_style = {
+            "header_color": GOLD_E,
+            "header_scale": 0.6,
+            "header_weight": "BOLD",
+            "grid_config": {"stroke_opacity": 1},
+        }
+
+        def row_colors(n_rows):
+            # header in GOLD_E, body in GOLD_A => one color per row of each table
+            return [GOLD_E] + [GOLD_A] * (n_rows - 1)
 
         # ======================================================
         # 4. CREATE THE FULL TABLE (ALL ROWS)
         # ======================================================
-        table = VGroup()
-        for i, row in enumerate(rows):
-            for j, value in enumerate(row):
-                cell_text = (
-                    Text(str(value), weight="BOLD", color=GOLD_E).scale(0.6)
-                    if i == 0
-                    else Text(str(value), color=GOLD_A).scale(0.5)
-                )
-                cell_border = Rectangle(
-                    width=column_widths[j], height=y_spacing, color=GOLD_A
-                )
-                cell_text.move_to([x_positions[j], -i * y_spacing, 0])
-                cell_border.move_to([x_positions[j], -i * y_spacing, 0])
-                table.add(VGroup(cell_border, cell_text))
+        # Cell borders are one grid mobject, so Create/shift touch one object.
+        table = DataTable(
+            rows,
+            column_widths,
+            row_height=y_spacing,
+            row_colors=row_colors(len(rows)),
+            **table_style,
+        )
         table.shift(UP * (config.frame_height / 2 - table.get_top()[1]))
         self.play(Create(table), run_time=5)
         self.wait()
@@ -108,35 +115,17 @@ class DataToHist01(Scene):
         # ======================================================
         # 6. CREATE THE REDUCED TABLE (TOP 6, DUMMY, BOTTOM 3)
         # ======================================================
-        top_rows = data.head(6)
-        bottom_rows = data.tail(3)
-        dummy_row = pd.DataFrame([["...", "...", "..."]], columns=data.columns)
-        combined_data = pd.concat([top_rows, dummy_row, bottom_rows], ignore_index=True)
-        reduced_rows = [list(combined_data.columns)] + combined_data.values.tolist()
+        # view over data => no dummy row, ages stay numeric
+        preview = TablePreview(data, head=6, tail=3)
+        reduced_rows = preview.display_rows()
 
-        reduced_table = VGroup()
-        for i, row in enumerate(reduced_rows):
-            for j, value in enumerate(row):
-                if 7 <= i < len(reduced_rows) - 3:
-                    if j == 1:
-                        dots = VGroup(
-                            Text("...").move_to([x_positions[0], -i * y_spacing, 0]),
-                            Text("...").move_to([x_positions[1], -i * y_spacing, 0]),
-                            Text("...").move_to([x_positions[2], -i * y_spacing, 0]),
-                        )
-                        reduced_table.add(dots)
-                    continue
-                cell_text = (
-                    Text(str(value), weight="BOLD", color=GOLD_E).scale(0.6)
-                    if i == 0
-                    else Text(str(value), color=GOLD_A).scale(0.5)
-                )
-                cell_border = Rectangle(
-                    width=column_widths[j], height=y_spacing, color=GOLD_A
-                )
-                cell_text.move_to([x_positions[j], -i * y_spacing, 0])
-                cell_border.move_to([x_positions[j], -i * y_spacing, 0])
-                reduced_table.add(VGroup(cell_border, cell_text))
+        reduced_table = DataTable(
+            reduced_rows,
+            column_widths,
+            row_height=y_spacing,
+            row_colors=row_colors(len(reduced_rows)),
+            **table_style,
+        )
         reduced_table.scale(0.7)
         reduced_table.to_edge(LEFT)
         reduced_table.shift(UP * (3 - reduced_table.get_top()[1]))
@@ -207,8 +196,19 @@ class DataToHist01(Scene):
         # 10. ANIMATE DOT TRANSFER & RUNNING-MEAN INDICATOR
         # ======================================================
         # Initialize running-mean data.
-        animated_ages = []  # List of all ages that have been animated (for computing the mean)
-        frequencies = {}  # Dictionary: age -> number of dots already placed
+        # Running statistics of all ages animated so far: each added age updates the
+        # mean in O(1) (and the median in O(log n)), without summing the list again.
+        running = RunningStats()
+        # Histogram with one bar per age: its counts array holds the number of dots
+        # already placed per age, and each added age only reshapes that age's bar.
+        age_hist = LiveHistogram(
+            np.arange(min_age - 0.5, max_age + 1.5),
+            number_line,
+            vertical_step,
+            bar_width=0.4,
+            color=BLUE,
+            fill_opacity=0.7,
+        )
         mean_indicator = None  # Will hold the arrow+label for the mean
 
         # Helper: create a mean indicator (arrow + label) at the x-coordinate for the mean.
@@ -229,10 +229,9 @@ class DataToHist01(Scene):
             print(age)
 
         # -- Animate Top Rows (cells 1-6) --
-        for i, row in enumerate(rows[1:7]):
-            age = row[2]
+        for i, age in enumerate(preview.head["Leeftijd"]):
             # Get the center of the cell from the reduced table (using an appropriate index offset)
-            cell_center = reduced_table[(i + 1) * 3 + 2].get_center()
+            cell_center = reduced_table.get_cell_center(i + 1, 2)
             processed_ages.add(age)
             # Highlight the cell temporarily.
             highlight_cell = Rectangle(
@@ -240,12 +239,12 @@ class DataToHist01(Scene):
             ).move_to(cell_center)
             self.play(Create(highlight_cell), run_time=0.5)
             # Create a temporary text copy for the animation.
-            anim_text = Text(str(age), color=RED).scale(0.5).move_to(cell_center)
+            anim_text = cached_text(age, RED, scale=0.5).move_to(cell_center)
             self.play(FadeIn(anim_text), run_time=0.5)
             # Compute target position using the frequency for this age.
             target_position = (
                 number_line.n2p(age)
-                + UP * (frequencies.get(age, 0) + 1) * vertical_step
+                + UP * (age_hist.get_count(age) + 1) * vertical_step
             )
             new_dot = Dot(color=BLUE).move_to(cell_center)
             self.play(
@@ -253,14 +252,13 @@ class DataToHist01(Scene):
                 run_time=0.7,
             )
             self.play(FadeOut(anim_text), run_time=0.3)
-            animated_ages.append(age)
-            frequencies.setdefault(age, 0)
-            frequencies[age] += 1
+            running.add(age)
+            age_hist.add_values(age)
             points.add(new_dot)
             self.play(FadeOut(highlight_cell), run_time=0.2)
             # Update the running mean indicator if at least 2 dots exist.
-            if len(animated_ages) >= 2:
-                current_mean = sum(animated_ages) / len(animated_ages)
+            if running.n >= 2:
+                current_mean = running.mean
                 new_indicator = create_mean_indicator(current_mean)
                 if mean_indicator is None:
                     mean_indicator = new_indicator
@@ -271,23 +269,24 @@ class DataToHist01(Scene):
                     mean_indicator.set_z_index(10)
                 self.wait(0.3)
 
-        # -- Animate Middle Rows (ages from index 6 to -3) --
-        for age in leeftijden[6:-3]:
+        # -- Animate Middle Rows (the ages hidden behind "...") --
+        for age in preview.hidden["Leeftijd"]:
             processed_ages.add(age)
-            animated_ages.append(age)
+            running.add(age)
             # Use a starting position offset from the reduced table.
-            start_position = reduced_table[7 * 3].get_center() + RIGHT * 1
+            start_position = (
+                reduced_table.get_cell_center(preview.ellipsis_row, 1) + RIGHT * 1
+            )
             point = Dot(color=BLUE).move_to(start_position)
             target_position = (
                 number_line.n2p(age)
-                + UP * (frequencies.get(age, 0) + 1) * vertical_step
+                + UP * (age_hist.get_count(age) + 1) * vertical_step
             )
             self.play(point.animate.move_to(target_position), run_time=0.1)
-            frequencies.setdefault(age, 0)
-            frequencies[age] += 1
+            age_hist.add_values(age)
             points.add(point)
             # Update mean indicator.
-            current_mean = sum(animated_ages) / len(animated_ages)
+            current_mean = running.mean
             new_indicator = create_mean_indicator(current_mean)
             if mean_indicator is None:
                 mean_indicator = new_indicator
@@ -297,20 +296,19 @@ class DataToHist01(Scene):
             self.wait(0.2)
 
         # -- Animate Bottom Rows (last 3 cells) --
-        for i, row in enumerate(reduced_rows[-3:]):
-            age = row[2]
-            cell_center = reduced_table[(8 * 3 + i * 3)].get_center()
+        for i, age in enumerate(preview.tail["Leeftijd"]):
+            cell_center = reduced_table.get_cell_center(preview.tail_start_row + i, 2)
             processed_ages.add(age)
-            animated_ages.append(age)
+            running.add(age)
             highlight_cell = Rectangle(
                 width=column_widths[2], height=y_spacing, color=RED
             ).move_to(cell_center)
             self.play(Create(highlight_cell), run_time=0.5)
-            anim_text = Text(str(age), color=RED).scale(0.5).move_to(cell_center)
+            anim_text = cached_text(age, RED, scale=0.5).move_to(cell_center)
             self.play(FadeIn(anim_text), run_time=0.5)
             target_position = (
                 number_line.n2p(age)
-                + UP * (frequencies.get(age, 0) + 1) * vertical_step
+                + UP * (age_hist.get_count(age) + 1) * vertical_step
             )
             new_dot = Dot(color=BLUE).move_to(cell_center)
             self.play(
@@ -318,12 +316,11 @@ class DataToHist01(Scene):
                 run_time=0.7,
             )
             self.play(FadeOut(anim_text), run_time=0.3)
-            frequencies.setdefault(age, 0)
-            frequencies[age] += 1
+            age_hist.add_values(age)
             points.add(new_dot)
             self.play(FadeOut(highlight_cell), run_time=0.2)
             # Update mean indicator.
-            current_mean = sum(animated_ages) / len(animated_ages)
+            current_mean = running.mean
             new_indicator = create_mean_indicator(current_mean)
             if mean_indicator is None:
                 mean_indicator = new_indicator
@@ -337,15 +334,8 @@ class DataToHist01(Scene):
         # ======================================================
         # 11. BUILD THE HISTOGRAM BARS & TRANSITION FROM DOTS
         # ======================================================
-        bars = VGroup()
-        for age, freq in frequencies.items():
-            bar = Rectangle(
-                width=0.4,
-                height=freq * vertical_step,
-                color=BLUE,
-                fill_opacity=0.7,
-            ).next_to(number_line.n2p(age), UP, buff=0)
-            bars.add(bar)
+        # The bars were kept up to date while the dots landed, nothing to build here.
+        bars = age_hist
         print(f"Missing age: {set(leeftijden) - processed_ages}")
         print(f"Total points stored: {len(points)}")
         for i, dot in enumerate(points):
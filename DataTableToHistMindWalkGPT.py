@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from manim import (
     Scene,
@@ -8,14 +9,11 @@ from manim import (
     LEFT,
     RIGHT,
     PI,
-    DEGREES,
     smooth,
     Create,
     FadeIn,
     FadeOut,
-    Transform,
     Write,
-    MoveAlongPath,
     VGroup,
     Text,
     Rectangle,
@@ -23,14 +21,34 @@ from manim import (
     MathTex,
     DashedLine,
     Arrow,
-    Axes,
-    ParametricFunction,
     RED,
     GOLD_A,
 )
 
+from DescriptiveStats import grouped_stats
+from DotAnimations import ArcFlight, BulkFlight, DotCloud
+from GlyphCache import cached_text, glyph_cache_info
+from HistLayout import (
+    bin_label_texts,
+    bin_layout,
+    stack_counts,
+    stack_indices,
+    stack_keys,
+    stack_targets,
+)
+from HistMobjects import (
+    DotBarHistogram,
+    FacetGrid,
+    HistogramMorph,
+    LiveHistogram,
+)
+from Resampling import grouped_bootstrap_ci
+from SceneTools import CoalescingScene
+from TableMobjects import DataTable, WindowedTable, condition_colors
+from TablePreview import TablePreview
+
 
-class DataToHistMW_GPT(Scene):
+class DataToHistMW_GPT(CoalescingScene, Scene):
     def construct(self):
         """
         Demonstration script that:
@@ -38,9 +56,9 @@ class DataToHistMW_GPT(Scene):
           2) Creates a 4-col 'reduced' table (ID, Cond, KvL Score, KvL Klasse).
              Animates the 4th column from blank to actual class labels.
           3) Transforms that 4-col to a new 3-col (ID, Cond, KvL Klasse).
-          4) Builds two histogram axes for two conditions (Wandeling & Mindfulness).
+          4) Builds one histogram axes per condition (Wandeling & Mindfulness).
           5) Animates data from table cells -> stacked dots in bins.
-          6) Transforms stacked dots -> bars.
+          6) Morphs stacked dots -> bars.
           7) Displays summary stats (M, MED, SD, SK) + arrows/dashed lines for mean/median.
         """
 
@@ -74,13 +92,16 @@ class DataToHistMW_GPT(Scene):
             {"Mindfullness": "Mindfulness", "Short Walk": "Wandeling"}
         )
 
-        # create 5‑wide bins => KvL Klasse
-        bin_edges = list(range(0, 105, 5))
-        bin_labels = [
-            f"{bin_edges[i]}-{bin_edges[i + 1]}" for i in range(len(bin_edges) - 1)
-        ]
-        data["KvL Klasse"] = pd.cut(
-            data["KvL Score"], bins=bin_edges, labels=bin_labels, right=True
+        # create 5‑wide bins around the data => integer codes (right-closed like pd.cut,
+        # -1 => none) + axis ranges from the counts, "a-b" labels only for KvL Klasse
+        binning = bin_layout(
+            data["KvL Score"], data["Conditie"], rule="fixed", width=5, right=True
+        )
+        bin_edges = binning.edges
+        n_bins = len(bin_edges) - 1
+        klasse_codes = binning.codes
+        data["KvL Klasse"] = pd.Categorical.from_codes(
+            klasse_codes, categories=bin_label_texts(bin_edges)
         )
 
         # ============= 3) FULL 3‑COLUMN TABLE =============
@@ -89,45 +110,25 @@ class DataToHistMW_GPT(Scene):
 
         col_widths_3 = [1, 2, 2]
         y_spacing = 0.75
-        x_pos_3 = [
-            sum(col_widths_3[:j]) + col_widths_3[j] / 2 - sum(col_widths_3) / 2
-            for j in range(len(col_widths_3))
-        ]
-
-        table_3col = VGroup()
-        for i, row in enumerate(rows_3col):
-            for j, val in enumerate(row):
-                if i == 0:
-                    txt_color = "#FFD700"  # header
-                else:
-                    cond = row[1]
-                    txt_color = color_map.get(cond, color_map["Other"])
-                txt = Text(str(val), color=txt_color).scale(0.5)
-                rect = Rectangle(
-                    width=col_widths_3[j],
-                    height=y_spacing,
-                    color=GOLD_A,
-                    stroke_opacity=0.4,
-                )
-                xcoord = x_pos_3[j]
-                txt.move_to([xcoord, -i * y_spacing, 0])
-                rect.move_to([xcoord, -i * y_spacing, 0])
-                table_3col.add(VGroup(rect, txt))
+        row_colors_3 = condition_colors(data.head(100), color_map)
+        # windowed => only rows inside the frame get mobjects, in reused row slots
+        table_3col = WindowedTable(
+            rows_3col,
+            col_widths_3,
+            row_height=y_spacing,
+            row_colors=row_colors_3,
+            top=config.frame_height / 2 - 0.5,
+        )
 
-        # shift table near top
-        t3_top_y = table_3col.get_top()[1]
-        desired_top = config.frame_height / 2 - 0.5
-        table_3col.shift(UP * (desired_top - t3_top_y))
+        print("Glyph cache after 3-col table:", glyph_cache_info())
 
         self.play(Create(table_3col), run_time=5)
         self.wait()
 
-        # shift downward so more rows are visible
-        bottom_3col = table_3col.get_bottom()[1]
-        screen_bot = -config.frame_height / 2
+        # scroll so more rows are visible
         self.play(
-            table_3col.animate.shift(
-                DOWN * (bottom_3col - screen_bot) + UP * (y_spacing * 4 / 3)
+            table_3col.scroll.animate.set_value(
+                table_3col.get_scroll_to_end(y_spacing * 4 / 3)
             ),
             run_time=12,
             rate_func=smooth,
@@ -135,47 +136,22 @@ class DataToHistMW_GPT(Scene):
         self.wait(5)
 
         # ============= 4) REDUCED TABLE (4 COLUMNS) =============
-        # top 5, dummy "...", bottom 4
-        dummy_row = pd.DataFrame([["..."] * len(data.columns)], columns=data.columns)
-        top_5 = data.head(5)
-        bot_4 = data.tail(4)
-        reduced_data = pd.concat([top_5, dummy_row, bot_4], ignore_index=True)
+        # top 5, "..." row, bottom 4 => view over data, no dummy row
+        preview = TablePreview(data, head=5, tail=4)
         # rows_4col => (ID, Cond, KvL Score, KvL Klasse)
-        rows_4col = [list(reduced_data.columns)] + reduced_data.values.tolist()
+        rows_4col = preview.display_rows()
 
         col_widths_4 = [1, 2, 2, 2]
-        x_pos_4 = [
-            sum(col_widths_4[:j]) + col_widths_4[j] / 2 - sum(col_widths_4) / 2
-            for j in range(len(col_widths_4))
-        ]
-
-        table_4col = VGroup()
-        for i, row in enumerate(rows_4col):
-            for j, val in enumerate(row):
-                if i == 0:
-                    color_txt = "#FFD700"
-                    disp_val = str(val)
-                    txt_obj = Text(disp_val, color=color_txt).scale(0.5)
-                else:
-                    cond = row[1]
-                    color_txt = color_map.get(cond, color_map["Other"])
-                    # col 3 => we start blank
-                    if j == 3:
-                        disp_val = ""
-                        txt_obj = Text(disp_val, color=color_txt).scale(0.4)
-                    else:
-                        disp_val = str(val)
-                        txt_obj = Text(disp_val, color=color_txt).scale(0.5)
-                border = Rectangle(
-                    width=col_widths_4[j],
-                    height=y_spacing,
-                    color=GOLD_A,
-                    stroke_opacity=0.4,
-                )
-                xx = x_pos_4[j]
-                txt_obj.move_to([xx, -i * y_spacing, 0])
-                border.move_to([xx, -i * y_spacing, 0])
-                table_4col.add(VGroup(border, txt_obj))
+        # col 3 => we start blank
+        display_4col = [rows_4col[0]] + [row[:3] + [""] for row in rows_4col[1:]]
+        row_colors_4 = condition_colors(preview, color_map)
+        table_4col = DataTable(
+            display_4col,
+            col_widths_4,
+            row_height=y_spacing,
+            row_colors=row_colors_4,
+            text_scales=[0.5, 0.5, 0.5, 0.4],
+        )
 
         table_4col.scale(0.7)
         table_4col.to_edge(LEFT)
@@ -186,74 +162,26 @@ class DataToHistMW_GPT(Scene):
         self.play(FadeOut(table_3col), FadeIn(table_4col), run_time=3)
         self.wait()
 
-        # animate the 4th column
-        n_rows_4 = len(rows_4col)  # 1 header + top5 + dummy + bottom4 => 1+10=11
-        for i in range(1, n_rows_4):
-            cell = table_4col[i * 4 + 3]
-            actual_value = str(rows_4col[i][3])
-            if actual_value == "...":
-                # skip dummy
-                continue
-            cond = rows_4col[i][1]
-            tcol = color_map.get(cond, color_map["Other"])
-            new_label = (
-                Text(actual_value, color=tcol).scale(0.4).move_to(cell[1].get_center())
+        # animate the 4th column => one segment, skip dummy
+        klasse_values = [
+            None if kl is None else str(kl)
+            for kl in preview.display_column("KvL Klasse", marker=None)
+        ]
+        self.play(
+            table_4col.reveal_column(
+                3, klasse_values, hold=lambda i: max(0.1, 0.5 - 0.03 * i)
             )
-            self.play(Transform(cell[1], new_label), run_time=0.5)
-            self.wait(max(0.1, 0.5 - 0.03 * i))
+        )
         self.wait(2)
 
-        # ============= 5) CREATE THE FINAL 3-COL => "new_reduced_rows" =============
+        # ============= 5) DROP "KvL Score" => FINAL 3-COL TABLE =============
         # so we can animate cells => bins
         # We keep columns: ID(0), Cond(1), KvL Klasse(3)
         self.wait(3)
-        new_reduced_rows = []
-        for row in rows_4col:
-            # row => [ID, Cond, KvL Score, KvL Klasse]
-            # keep => [ID, Cond, KvL Klasse]
-            new_reduced_rows.append([row[0], row[1], row[3]])
-
-        # build the new table => 3 columns
-        col_widths_3b = [1, 2, 2]
-        x_pos_3b = [
-            sum(col_widths_3b[:j]) + col_widths_3b[j] / 2 - sum(col_widths_3b) / 2
-            for j in range(len(col_widths_3b))
-        ]
 
-        new_table_3b = VGroup()
-        for i, row in enumerate(new_reduced_rows):
-            for j, val in enumerate(row):
-                if i == 0:
-                    # header => gold
-                    txt_color = "#FFD700"
-                    txt_obj = Text(str(val), color=txt_color).scale(0.5)
-                else:
-                    cond = row[1]
-                    txt_color = color_map.get(cond, color_map["Other"])
-                    if j == 2:
-                        txt_obj = Text(str(val), color=txt_color).scale(0.4)
-                    else:
-                        txt_obj = Text(str(val), color=txt_color).scale(0.5)
-
-                rect = Rectangle(
-                    width=col_widths_3b[j],
-                    height=y_spacing,
-                    color=GOLD_A,
-                    stroke_opacity=0.4,
-                )
-                xx = x_pos_3b[j]
-                txt_obj.move_to([xx, -i * y_spacing, 0])
-                rect.move_to([xx, -i * y_spacing, 0])
-                new_table_3b.add(VGroup(rect, txt_obj))
-
-        new_table_3b.scale(0.7)
-        new_table_3b.to_edge(LEFT)
-        top3b = new_table_3b.get_top()[1]
-        desired3b = config.frame_height / 2 - 0.5
-        new_table_3b.shift(UP * (desired3b - top3b))
-
-        # transform the 4-col => new 3-col
-        self.play(Transform(table_4col, new_table_3b), run_time=1)
+        # drop "KvL Score" => the other cells are reused, only that column fades out
+        # and KvL Klasse slides into its place
+        self.play(table_4col.drop_column("KvL Score"), run_time=1)
         self.wait(2)
 
         # reduce stroke, add outer frame
@@ -270,329 +198,233 @@ class DataToHistMW_GPT(Scene):
         self.wait(2)
 
         # ============= 6) SETUP HISTOGRAM AXES =============
-        x_range = [0, 100, 5]
-        y_range = [0, 11, 2]
-
-        # custom ticks => midpoints => 2.5, 7.5, ...
-        custom_tick_positions = [2.5 + 5 * i for i in range(20)]
-        custom_tick_labels = [f"{5 * i}-{5 * (i + 1)}" for i in range(20)]
-
-        # top axes => Wandeling
-        axes_top = Axes(
-            x_range=x_range,
-            y_range=y_range,
-            x_length=8,
-            y_length=2.5,
-            axis_config={"color": GOLD_A, "include_numbers": False},
-            x_axis_config={
-                "include_numbers": True,
-                "numbers_to_include": custom_tick_positions,
-                "include_tip": False,
-            },
-            y_axis_config={
-                "include_numbers": True,
-                "numbers_to_include": range(0, 12, 2),
-                "numbers_to_exclude": [],
-                "include_tip": False,
-            },
-        )
-        axes_top.to_edge(RIGHT, buff=0.8)
-        axes_top.shift(UP * 2.3)
-
-        # replace x ticks => custom labels
-        for i, tick in enumerate(axes_top.x_axis.numbers):
-            lbl = Text(custom_tick_labels[i], font_size=15, color=GOLD_A)
-            lbl.rotate(45 * DEGREES)
-            lbl.move_to(tick.get_center())
-            tick.become(lbl)
-        for t in axes_top.y_axis.numbers:
-            t.set(font_size=18)
-        for tk in axes_top.x_axis.get_tick_marks():
-            tk.set_stroke(width=1, opacity=0.5)
-        for tk in axes_top.y_axis.get_tick_marks():
-            tk.set_stroke(width=1, opacity=0.5)
-
-        vert_lab_top = Text("Frequentie", font_size=15, color=GOLD_A).rotate(PI / 2)
-        vert_lab_top.next_to(axes_top.y_axis, LEFT, buff=0.0)
-        title_top = Text(
-            "KvL Scores voor Conditie 'Wandeling'", font_size=20, color=GOLD_A
-        )
-        title_top.next_to(axes_top, UP, buff=0.0)
-
-        # bottom => Mindfulness
-        axes_bottom = Axes(
-            x_range=x_range,
-            y_range=y_range,
+        x_range = binning.x_range
+        y_range = binning.y_range
+
+        # one facet per condition (order of first appearance) => same bins, one step,
+        # bin labels + y numbers from the shared glyph caches => no default numbers
+        facet_levels = list(pd.unique(data["Conditie"]))
+        facets = FacetGrid(
+            facet_levels,
+            bin_edges,
+            y_range,
+            buff=0.5,
             x_length=8,
             y_length=2.5,
-            axis_config={"color": GOLD_A, "include_numbers": False},
-            x_axis_config={
-                "include_numbers": True,
-                "numbers_to_include": custom_tick_positions,
-                "include_tip": False,
-            },
-            y_axis_config={
-                "include_numbers": True,
-                "numbers_to_include": range(0, 12, 2),
-                "numbers_to_exclude": [],
-                "include_tip": False,
-            },
+            y_font_size=15,
         )
-        axes_bottom.next_to(axes_top, DOWN, buff=0.5)
-        axes_bottom.align_to(axes_top, RIGHT)
-
-        for i, tick in enumerate(axes_bottom.x_axis.numbers):
-            lbl = Text(custom_tick_labels[i], font_size=15, color=GOLD_A)
-            lbl.rotate(45 * DEGREES)
-            lbl.move_to(tick.get_center())
-            tick.become(lbl)
-        for t in axes_bottom.y_axis.numbers:
-            t.set(font_size=15)
-        for tk in axes_bottom.x_axis.get_tick_marks():
-            tk.set_stroke(width=1, opacity=0.5)
-        for tk in axes_bottom.y_axis.get_tick_marks():
-            tk.set_stroke(width=1, opacity=0.5)
-
-        vert_lab_bot = Text("Frequentie", font_size=15, color=GOLD_A).rotate(PI / 2)
-        vert_lab_bot.next_to(axes_bottom.y_axis, LEFT, buff=0.0)
-        title_bottom = Text(
-            "KvL Scores voor Conditie 'Mindfulness'", font_size=20, color=GOLD_A
-        )
-        title_bottom.next_to(axes_bottom, UP, buff=-0.25)
-
-        self.play(Create(axes_top), Write(title_top), Write(vert_lab_top), run_time=4)
-        self.wait(1)
-        self.play(
-            Create(axes_bottom), Write(title_bottom), Write(vert_lab_bot), run_time=4
-        )
-        self.wait(2)
+        facets.to_edge(RIGHT, buff=0.8)
+        facets.shift(UP * (2.3 - facets[0].get_center()[1]))
+
+        # back-to-back plays => one partial movie file, same frames
+        with self.coalesce():
+            for f, (level, ax) in enumerate(zip(facet_levels, facets)):
+                vert_lab = Text("Frequentie", font_size=15, color=GOLD_A)
+                vert_lab.rotate(PI / 2)
+                vert_lab.next_to(ax.y_axis, LEFT, buff=0.0)
+                title = Text(
+                    f"KvL Scores voor Conditie '{level}'", font_size=20, color=GOLD_A
+                )
+                title.next_to(ax, UP, buff=0.0 if f == 0 else -0.25)
+                self.play(Create(ax), Write(title), Write(vert_lab), run_time=4)
+                self.wait(1)
+            self.wait(1)
 
         # ============= 7) ANIMATE TABLE CELLS => DOTS (HISTOGRAM BINS) =============
 
-        # build a map => "0-5" => 2.5, ...
-        klasse_midpoints = {f"{5 * i}-{5 * (i + 1)}": 2.5 + 5 * i for i in range(20)}
-
-        def parabola_path(p0, p1, height=1.5):
-            return ParametricFunction(
-                lambda t: (1 - t) ** 2 * p0
-                + 2 * (1 - t) * t * ((p0 + p1) / 2 + UP * height)
-                + t**2 * p1,
-                t_range=[0, 1],
-            ).set_stroke(width=2)
-
-        # measure vertical step from top => freq=0..1
-        y0t = axes_top.y_axis.n2p(0)
-        y1t = axes_top.y_axis.n2p(1)
-        vertical_step = (y1t - y0t)[1]
-
-        frequencies = {}
+        # vertical step => freq=0..1, shared by all facets
+        vertical_step = facets.vertical_step
+
+        # layout => every dot's stack height + target at once, loops only look up
+        klasses = data["KvL Klasse"].astype(str).to_numpy()
+        conds = data["Conditie"].to_numpy()
+        # facet per row => categorical code of its condition
+        facet_of = facets.facet_codes(conds)
+        dot_colors = condition_colors(data, color_map)[1:]
+        # (facet, bin) => one int key per row, -1 => no bin
+        keys = stack_keys(klasse_codes, facet_of, n_bins)
+        has_bin = keys >= 0
+        base_pts = facets.bin_points(facet_of, facets.midpoints[klasse_codes])
+        base_pts[~has_bin] = np.nan
+        dot_targets = stack_targets(base_pts, stack_indices(keys), vertical_step)
+        # final stack heights => bars, one bincount over the keys
+        frequencies = stack_counts(keys, n_bins * len(facets))
         dot_map = {}
 
-        # top rows => i=1..5
-        for i in range(1, 6):
-            row_data = new_reduced_rows[i]  # [ID, Cond, KvL Klasse]
-            cond = row_data[1]
-            klasse_label = row_data[2]
-            if klasse_label in ["", "..."]:
-                continue
-            # table_4col => we originally had 4 columns => the cell for (i, col=3) => index => i*4+3
-            cell_idx = i * 4 + 3
-            start_pos = table_4col[cell_idx].get_center()
-
-            freq_key = (klasse_label, cond)
-            frequencies[freq_key] = frequencies.get(freq_key, 0)
-
-            # pick color
-            if cond == "Wandeling":
-                target_axes = axes_top
-                dot_color = color_map["Wandeling"]
-            else:
-                target_axes = axes_bottom
-                dot_color = color_map["Mindfulness"]
-
-            # highlight
-            highlight = Rectangle(
-                width=col_widths_4[2],
-                height=y_spacing,
-                color=dot_color,
-            ).move_to(start_pos)
-            self.play(Create(highlight), run_time=0.7)
-
-            # temporary text
-            anim_txt = Text(str(klasse_label), color=dot_color).scale(0.5)
-            anim_txt.move_to(start_pos)
-            self.play(FadeIn(anim_txt), run_time=0.7)
-
-            mp_val = klasse_midpoints.get(klasse_label, None)
-            if mp_val is None:
-                continue
-
-            freq_cnt = frequencies[freq_key] + 1
-            x_axis_pos = target_axes.x_axis.n2p(mp_val)
-            target_pos = x_axis_pos + UP * (freq_cnt * vertical_step)
-
-            dot = Dot(color=dot_color, radius=0.05).move_to(start_pos)
-            dot_map.setdefault(freq_key, []).append(dot)
-            path = parabola_path(start_pos, target_pos, height=1.5)
-            self.play(MoveAlongPath(dot, path), run_time=0.9)
-
-            self.play(FadeOut(anim_txt), run_time=0.4)
-            frequencies[freq_key] = freq_cnt
-            self.play(FadeOut(highlight), run_time=0.3)
-            self.wait(0.1)
-
-        # leftover => dummy => index=6 => new_reduced_rows[6] => leftover data is from row 5..96
-        leftover_data = data.iloc[5:96]
-        for idx, row in leftover_data.iterrows():
-            kl = row["KvL Klasse"]
-            cond = row["Conditie"]
-            if kl in ["", "..."]:
-                continue
-            # the dummy row => i=6 => 4th col => i*4+3 => 6*4+3=27
-            dummy_cell_center = table_4col[6 * 4 + 3].get_center()
-            start_pos = dummy_cell_center
-
-            freq_key = (kl, cond)
-            frequencies[freq_key] = frequencies.get(freq_key, 0)
-
-            if cond == "Wandeling":
-                target_axes = axes_top
-                dot_color = color_map["Wandeling"]
-            else:
-                target_axes = axes_bottom
-                dot_color = color_map["Mindfulness"]
+        # ~6 short plays per row => one partial movie file for all rows
+        with self.coalesce():
+            # top rows => i=1..5
+            for i, k in enumerate(preview.head_range, start=1):
+                # no bin => nothing to fly, row is skipped
+                if not has_bin[k]:
+                    continue
+                klasse_label = klasses[k]
+                # the KvL Klasse cell => (i, col=2) of the table after the drop
+                start_pos = table_4col.get_cell_center(i, 2)
+
+                # pick color
+                dot_color = dot_colors[k]
+
+                # highlight
+                highlight = Rectangle(
+                    width=col_widths_4[2],
+                    height=y_spacing,
+                    color=dot_color,
+                ).move_to(start_pos)
+                self.play(Create(highlight), run_time=0.7)
+
+                # temporary text
+                anim_txt = cached_text(klasse_label, dot_color, scale=0.5)
+                anim_txt.move_to(start_pos)
+                self.play(FadeIn(anim_txt), run_time=0.7)
+
+                target_pos = dot_targets[k]
+                dot = Dot(color=dot_color, radius=0.05).move_to(start_pos)
+                dot_map.setdefault(keys[k], []).append(dot)
+                self.play(
+                    ArcFlight(dot, start_pos, target_pos, height=1.5), run_time=0.9
+                )
 
-            mp_val = klasse_midpoints.get(kl, None)
-            if mp_val is None:
-                continue
+                self.play(FadeOut(anim_txt), run_time=0.4)
+                self.play(FadeOut(highlight), run_time=0.3)
+                self.wait(0.1)
+
+            # leftover => rows hidden behind "..." => all start from its KvL Klasse cell
+            # targets are already laid out => one point cloud, all flown in one play()
+            hidden = np.arange(preview.hidden_range.start, preview.hidden_range.stop)
+            hidden = hidden[has_bin[hidden]]
+            dummy_cell_center = table_4col.get_cell_center(preview.ellipsis_row, 2)
+            flight_starts = np.tile(dummy_cell_center, (len(hidden), 1))
+            hidden_cloud = DotCloud(
+                flight_starts,
+                dot_colors[hidden],
+                radius=0.05,
+            )
 
-            freq_cnt = frequencies[freq_key] + 1
-            x_axis_pos = target_axes.x_axis.n2p(mp_val)
-            target_pos = x_axis_pos + UP * (freq_cnt * vertical_step)
+            # one dot every 0.2s, same pace as a play() per dot
+            if len(hidden):
+                self.play(
+                    BulkFlight(
+                        hidden_cloud,
+                        flight_starts,
+                        dot_targets[hidden],
+                        flight_time=0.2,
+                    )
+                )
 
-            dot = Dot(color=dot_color, radius=0.05).move_to(start_pos)
-            dot_map.setdefault(freq_key, []).append(dot)
+            # bottom rows => i=7..10
+            for i, k in enumerate(preview.tail_range, start=preview.tail_start_row):
+                if not has_bin[k]:
+                    continue
+                kl = klasses[k]
 
-            self.play(dot.animate.move_to(target_pos), run_time=0.2)
-            frequencies[freq_key] = freq_cnt
+                start_pos = table_4col.get_cell_center(i, 2)
+                dot_color = dot_colors[k]
 
-        # bottom rows => i=7..10
-        for i in range(7, 11):
-            row_data = new_reduced_rows[i]
-            kl = row_data[2]
-            cond = row_data[1]
-            if kl in ["", "..."]:
-                continue
+                highlight = Rectangle(
+                    width=col_widths_4[2],
+                    height=y_spacing,
+                    color=dot_color,
+                ).move_to(start_pos)
+                self.play(Create(highlight), run_time=0.5)
+                anim_txt = cached_text(kl, dot_color, scale=0.5).move_to(start_pos)
+                self.play(FadeIn(anim_txt), run_time=0.5)
+
+                target_pos = dot_targets[k]
+                dot = Dot(color=dot_color, radius=0.05).move_to(start_pos)
+                dot_map.setdefault(keys[k], []).append(dot)
+                self.play(
+                    ArcFlight(dot, start_pos, target_pos, height=0.5), run_time=0.7
+                )
 
-            cell_idx = i * 4 + 3
-            start_pos = table_4col[cell_idx].get_center()
+                self.play(FadeOut(anim_txt), run_time=0.3)
+                self.play(FadeOut(highlight), run_time=0.2)
+                self.wait(0.1)
 
-            freq_key = (kl, cond)
-            frequencies[freq_key] = frequencies.get(freq_key, 0)
+            self.wait(2)
 
-            if cond == "Wandeling":
-                target_axes = axes_top
-                dot_color = color_map["Wandeling"]
-            else:
-                target_axes = axes_bottom
-                dot_color = color_map["Mindfulness"]
-
-            highlight = Rectangle(
-                width=col_widths_4[2],
-                height=y_spacing,
-                color=dot_color,
-            ).move_to(start_pos)
-            self.play(Create(highlight), run_time=0.5)
-            anim_txt = Text(kl, color=dot_color).scale(0.5).move_to(start_pos)
-            self.play(FadeIn(anim_txt), run_time=0.5)
-
-            mp_val = klasse_midpoints.get(kl, None)
-            if mp_val is None:
-                continue
-            freq_cnt = frequencies[freq_key] + 1
-            x_axis_pos = target_axes.x_axis.n2p(mp_val)
-            target_pos = x_axis_pos + UP * (freq_cnt * vertical_step)
-
-            dot = Dot(color=dot_color, radius=0.05).move_to(start_pos)
-            dot_map.setdefault(freq_key, []).append(dot)
-            path = parabola_path(start_pos, target_pos, height=0.5)
-            self.play(MoveAlongPath(dot, path), run_time=0.7)
-
-            self.play(FadeOut(anim_txt), run_time=0.3)
-            frequencies[freq_key] = freq_cnt
-            self.play(FadeOut(highlight), run_time=0.2)
-            self.wait(0.1)
+        # ============= 8) DOTS => BARS TRANSITION =============
+        # one histogram mobject => every bin goes dots -> bar in closed form
+        # one class wide => bin width * x-axis unit size
+        bar_width = x_range[2] * facets[0].x_axis.get_unit_size()
+        # non-empty keys => (facet, bin) by divmod
+        bin_keys = np.flatnonzero(frequencies)
+        bin_facets, bin_klasses = np.divmod(bin_keys, n_bins)
+        bin_base = facets.bin_points(bin_facets, facets.midpoints[bin_klasses])
+        bin_colors = [
+            color_map.get(facet_levels[f], color_map["Other"]) for f in bin_facets
+        ]
+        dot_hist = DotBarHistogram(
+            bin_base,
+            frequencies[bin_keys],
+            vertical_step,
+            bar_width,
+            bin_colors,
+            dot_radius=0.05,
+        )
 
-        self.wait(2)
+        # morph=0 => dots on the same spots => swap, then morph in one animation
+        self.remove(hidden_cloud, *[dot for dots in dot_map.values() for dot in dots])
+        self.add(dot_hist)
+        self.play(HistogramMorph(dot_hist, 1), run_time=2)
 
-        # ============= 8) DOTS => BARS TRANSITION =============
+        # outlined bars => one live histogram per facet, all scores added in one call
+        scores = data["KvL Score"].to_numpy()
         bars = VGroup()
-        transforms = []
-        top_xlen = axes_top.x_length
-
-        for (klass_label, cond_label), freq_count in frequencies.items():
-            if freq_count <= 0:
-                continue
-            if (klass_label, cond_label) not in dot_map:
-                continue
-            dot_list = dot_map[(klass_label, cond_label)]
-            dot_group = VGroup(*dot_list)
-
-            if cond_label == "Wandeling":
-                target_axes = axes_top
-                bar_c = color_map["Wandeling"]
-            else:
-                target_axes = axes_bottom
-                bar_c = color_map["Mindfulness"]
-
-            mp_val = klasse_midpoints.get(klass_label, None)
-            if mp_val is None:
-                continue
-            x_coord = target_axes.x_axis.n2p(mp_val)
-            bar_height = freq_count * vertical_step
-
-            bar_width = 5 * (top_xlen / (x_range[1] - x_range[0]))  # ~0.4
-            bar_rect = Rectangle(
-                width=bar_width,
-                height=bar_height,
+        for f, (level, ax) in enumerate(zip(facet_levels, facets)):
+            bar_c = color_map.get(level, color_map["Other"])
+            hist = LiveHistogram(
+                bin_edges,
+                ax.x_axis,
+                vertical_step,
                 color=bar_c,
-                fill_color=bar_c,
                 fill_opacity=0.8,
+                right=True,
             )
-            bar_rect.move_to(x_coord, aligned_edge=DOWN)
+            bars.add(hist.add_values(scores[facet_of == f]))
 
-            transforms.append(Transform(dot_group, bar_rect))
-            bars.add(bar_rect)
-
-        self.play(*transforms, run_time=2)
         self.play(FadeIn(bars))
         self.wait(2)
 
         # ============= 9) SUMMARY STATS + MEAN/MEDIAN LINES =============
-        means = data.groupby("Conditie")["KvL Score"].mean()
-        medians = data.groupby("Conditie")["KvL Score"].median()
-        stds = data.groupby("Conditie")["KvL Score"].std()
-        skews = data.groupby("Conditie")["KvL Score"].skew()
+        # one pass => n, M, MED, SD, SK, SE, CI per condition
+        cond_stats = grouped_stats(data["KvL Score"], data["Conditie"])
+        # bootstrap => 95% intervals of mean + median, fixed seed => same every render
+        cond_cis = grouped_bootstrap_ci(
+            data["KvL Score"], data["Conditie"], n_resamples=10000, seed=0
+        )
 
         def stats_block(cond_name, color):
-            mu = means[cond_name]
-            md = medians[cond_name]
-            sd = stds[cond_name]
-            sk = skews[cond_name]
+            st = cond_stats[cond_name]
+            mu, md, sd, sk = st.mean, st.median, st.sd, st.skew
             l1 = MathTex(rf"\mathit{{M}} = {mu:.2f}", color=color, font_size=20)
             l2 = MathTex(rf"\mathit{{MED}} = {md:.2f}", color=color, font_size=20)
             l3 = MathTex(rf"\mathit{{SD}} = {sd:.2f}", color=color, font_size=20)
             l4 = MathTex(rf"\mathit{{SK}} = {sk:.2f}", color=color, font_size=20)
-            return VGroup(l1, l2, l3, l4).arrange(DOWN, buff=0.2, aligned_edge=LEFT)
-
-        stats_w = stats_block("Wandeling", color_map["Wandeling"])
-        stats_m = stats_block("Mindfulness", color_map["Mindfulness"])
+            m_lo, m_hi = cond_cis[cond_name]["mean"]
+            md_lo, md_hi = cond_cis[cond_name]["median"]
+            l5 = MathTex(
+                rf"\mathit{{BI}}_{{M}} = [{m_lo:.1f},\ {m_hi:.1f}]",
+                color=color,
+                font_size=20,
+            )
+            l6 = MathTex(
+                rf"\mathit{{BI}}_{{MED}} = [{md_lo:.1f},\ {md_hi:.1f}]",
+                color=color,
+                font_size=20,
+            )
+            return VGroup(l1, l2, l3, l4, l5, l6).arrange(
+                DOWN, buff=0.1, aligned_edge=LEFT
+            )
 
-        # place them near each axis
-        stats_w.next_to(axes_top.y_axis, RIGHT, buff=0.5).shift(UP * 0.1)
-        stats_m.next_to(axes_bottom.y_axis, RIGHT, buff=0.5).shift(UP * 0.1)
+        # one block per facet => next to its y axis
+        stats_blocks = VGroup()
+        for level, ax in zip(facet_levels, facets):
+            block = stats_block(level, color_map.get(level, color_map["Other"]))
+            block.next_to(ax.y_axis, RIGHT, buff=0.5).shift(UP * 0.1)
+            stats_blocks.add(block)
 
-        self.play(FadeIn(stats_w), FadeIn(stats_m))
+        self.play(*[FadeIn(block) for block in stats_blocks])
         self.wait(1)
 
         def add_stat_indicator(ax, x_val, color, label_tex, is_median=False):
@@ -623,33 +455,17 @@ class DataToHistMW_GPT(Scene):
                 lbl.next_to(arr, DOWN * 0.1 + LEFT, buff=0.10)
                 return VGroup(arr, lbl)
 
-        # top => Wandeling
-        mean_w = means["Wandeling"]
-        med_w = medians["Wandeling"]
-        w_mean_ind = add_stat_indicator(
-            axes_top, mean_w, color_map["Wandeling"], r"\mathit{M}", False
-        )
-        w_med_ind = add_stat_indicator(
-            axes_top, med_w, color_map["Wandeling"], r"\mathit{MED}", True
-        )
-
-        # bottom => Mindfulness
-        mean_m = means["Mindfulness"]
-        med_m = medians["Mindfulness"]
-        m_mean_ind = add_stat_indicator(
-            axes_bottom, mean_m, color_map["Mindfulness"], r"\mathit{M}", False
-        )
-        m_med_ind = add_stat_indicator(
-            axes_bottom, med_m, color_map["Mindfulness"], r"\mathit{MED}", True
-        )
-
-        self.play(
-            FadeIn(w_mean_ind),
-            FadeIn(w_med_ind),
-            FadeIn(m_mean_ind),
-            FadeIn(m_med_ind),
-            run_time=2,
-        )
+        # per facet => mean arrow + median dashed line
+        indicators = []
+        for level, ax in zip(facet_levels, facets):
+            color = color_map.get(level, color_map["Other"])
+            st = cond_stats[level]
+            indicators += [
+                add_stat_indicator(ax, st.mean, color, r"\mathit{M}", False),
+                add_stat_indicator(ax, st.median, color, r"\mathit{MED}", True),
+            ]
+
+        self.play(*[FadeIn(ind) for ind in indicators], run_time=2)
         self.wait(3)
 
 
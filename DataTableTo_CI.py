@@ -7,3 +7,382 @@
 # I want to add each data point one by one to a number line.
 # Using running mean, median, sd, Margin of Error, CI and skewness, we can show the mean and maybe median of the data points on a number line.
 # we use two horizontal axes, one for the sample data, and one for the estimation of the population parameters.
+
+import numpy as np
+import pandas as pd
+from manim import (
+    BLUE,
+    DOWN,
+    GOLD_A,
+    GOLD_E,
+    GREY,
+    LEFT,
+    PI,
+    RED,
+    RIGHT,
+    UP,
+    Axes,
+    Create,
+    DashedLine,
+    DecimalNumber,
+    Dot,
+    FadeIn,
+    LaggedStart,
+    Line,
+    MathTex,
+    NumberLine,
+    NumberPlane,
+    Scene,
+    Text,
+    ValueTracker,
+    VGroup,
+    Write,
+    linear,
+)
+
+from DescriptiveStats import running_estimates
+from DotAnimations import DotCloud
+from HistLayout import bin_layout, nice_step, stack_indices, stack_targets
+from HistMobjects import AccumulateValues, LiveHistogram
+from Resampling import simulate_sampling
+
+
+class DataToCI(Scene):
+    # path => the running estimates are also written there as CSV (off by default)
+    timeline_csv = None
+
+    def construct(self):
+        # ======================================================
+        # 1. SET UP THE BACKGROUND GRID
+        # ======================================================
+        grid = NumberPlane(
+            x_range=[-10, 10, 1],
+            y_range=[-10, 10, 1],
+            background_line_style={
+                "stroke_color": GREY,  # grid line color
+                "stroke_width": 1,  # grid line thickness
+                "stroke_opacity": 0.5,  # grid line opacity
+            },
+            axis_config={
+                "stroke_color": GREY,  # axis color
+                "stroke_width": 1,  # axis thickness
+            },
+        )
+        self.add(grid)
+
+        # ======================================================
+        # 2. LOAD THE DATA AND PRECOMPUTE THE RUNNING ESTIMATES
+        # ======================================================
+        data = pd.read_csv("Data/kvl_skew_data.csv", index_col=False)
+        data.columns = ["ID", "Conditie", "KvL Score"]
+        # the order in which the sample "arrives" => a random draw, fixed by the seed
+        rng = np.random.default_rng(12)
+        scores = rng.permutation(data["KvL Score"].to_numpy(dtype=float))
+        n_samples = len(scores)
+
+        # every estimate after k = 1..n samples, computed once => frames only index
+        timeline = running_estimates(scores)
+        if self.timeline_csv:
+            timeline.to_csv(self.timeline_csv)
+        print(timeline.tail(3))
+        estimates = {name: timeline[name].to_numpy() for name in timeline.columns}
+
+        # ======================================================
+        # 3. TWO AXES: SAMPLE DATA (TOP) AND ESTIMATE (BOTTOM)
+        # ======================================================
+        sample_axis = NumberLine(
+            x_range=[0, 100, 10],
+            length=10,
+            include_numbers=True,
+            color=GOLD_E,
+        ).shift(RIGHT * 1.5 + UP * 0.5)
+        estimate_axis = NumberLine(
+            x_range=[0, 100, 10],
+            length=10,
+            include_numbers=True,
+            color=GOLD_E,
+        ).shift(RIGHT * 1.5 + DOWN * 2.5)
+        sample_label = Text("Steekproef (KvL Score)", font_size=20, color=GOLD_A)
+        sample_label.next_to(sample_axis, DOWN, buff=0.5)
+        estimate_label = Text(
+            "Schatting populatiegemiddelde (95% BI)", font_size=20, color=GOLD_A
+        )
+        estimate_label.next_to(estimate_axis, DOWN, buff=0.5)
+        title = Text("Het populatiegemiddelde is onbekend", font_size=28, color=GOLD_A)
+        title.to_edge(UP, buff=0.4)
+
+        self.play(Write(title))
+        self.play(
+            Create(sample_axis),
+            Create(estimate_axis),
+            Write(sample_label),
+            Write(estimate_label),
+            run_time=2,
+        )
+        self.wait(1)
+
+        # ======================================================
+        # 4. SAMPLE DOTS, STACKED PER SCORE IN ORDER OF ARRIVAL
+        # ======================================================
+        dot_radius = 0.04
+        stack_step = 2.2 * dot_radius
+        dot_targets = stack_targets(
+            sample_axis.n2p(scores),
+            stack_indices(np.round(scores).astype(int)),
+            stack_step,
+        )
+        sample_dots = DotCloud(dot_targets, GOLD_A, radius=dot_radius)
+
+        # ======================================================
+        # 5. RUNNING ESTIMATES, ALL READ FROM THE TIMELINE
+        # ======================================================
+        # k = number of samples shown (from 3 on, when every estimate is defined);
+        # every updater reads row k of the timeline
+        k = ValueTracker(3)
+        arrival = np.arange(n_samples)
+
+        def current(name):
+            return estimates[name][round(k.get_value()) - 1]
+
+        sample_dots.add_updater(lambda m: m.set_visible(arrival < round(k.get_value())))
+
+        # running mean => vertical line over the sample, dot on the estimate axis
+        mean_line = Line(UP, DOWN, color=RED, stroke_width=3)
+        mean_line.add_updater(
+            lambda m: m.set_points_as_corners(
+                [
+                    sample_axis.n2p(current("mean")),
+                    sample_axis.n2p(current("mean")) + UP * 1.2,
+                ]
+            )
+        )
+        # confidence interval => thick line on the estimate axis
+        ci_line = Line(LEFT, RIGHT, color=BLUE, stroke_width=8)
+        ci_line.add_updater(
+            lambda m: m.set_points_as_corners(
+                [
+                    estimate_axis.n2p(current("ci_low")),
+                    estimate_axis.n2p(current("ci_high")),
+                ]
+            )
+        )
+        mean_dot = Dot(radius=0.08, color=RED)
+        mean_dot.add_updater(lambda m: m.move_to(estimate_axis.n2p(current("mean"))))
+
+        # readout => one label + number per estimate, numbers follow the timeline
+        readout_rows = [
+            (r"n", "n", 0),
+            (r"\mathit{M}", "mean", 2),
+            (r"\mathit{MED}", "median", 2),
+            (r"\mathit{SD}", "sd", 2),
+            (r"\mathit{SE}", "se", 2),
+            (r"\mathit{SK}", "skew", 2),
+            (r"\mathit{BI}_{min}", "ci_low", 2),
+            (r"\mathit{BI}_{max}", "ci_high", 2),
+        ]
+        readout = VGroup()
+        for tex, name, decimals in readout_rows:
+            label = MathTex(tex + " =", color=GOLD_A, font_size=26)
+            value = DecimalNumber(
+                current(name), num_decimal_places=decimals, color=GOLD_A, font_size=26
+            )
+            value.add_updater(lambda m, name=name: m.set_value(current(name)))
+            readout.add(VGroup(label, value).arrange(RIGHT, buff=0.15))
+        readout.arrange(DOWN, aligned_edge=LEFT, buff=0.2)
+        readout.to_edge(LEFT, buff=0.4).shift(DOWN * 0.5)
+
+        # updaters are suspended while fading in => put everything at k once first
+        for mob in (sample_dots, mean_line, ci_line, mean_dot, readout):
+            mob.update()
+        self.add(sample_dots)
+        self.play(FadeIn(mean_line), FadeIn(ci_line), FadeIn(mean_dot), FadeIn(readout))
+        self.wait(1)
+
+        # ======================================================
+        # 6. ADD THE SAMPLE: SLOWLY AT FIRST, THEN THE REST
+        # ======================================================
+        self.play(k.animate.set_value(20), run_time=12, rate_func=linear)
+        self.wait(1)
+        self.play(k.animate.set_value(n_samples), run_time=12, rate_func=linear)
+        self.wait(3)
+
+
+class SamplingToCI(Scene):
+    def construct(self):
+        """
+        What does "95% confidence" mean?
+          1) Treats the QoL scores of kvl_data.csv as a (pseudo-)population with
+             a known mean mu and draws 100000 samples of n = 20 from it.
+          2) Left: a ladder of the first 40 CIs, blue if it covers mu, red if not.
+          3) Right: the means of all samples pile up as a histogram, while the
+             share of CIs that cover mu settles near 95%.
+        """
+
+        # ======================================================
+        # 1. SET UP THE BACKGROUND GRID
+        # ======================================================
+        grid = NumberPlane(
+            x_range=[-10, 10, 1],
+            y_range=[-10, 10, 1],
+            background_line_style={
+                "stroke_color": GREY,
+                "stroke_width": 1,
+                "stroke_opacity": 0.5,
+            },
+            axis_config={"stroke_color": GREY, "stroke_width": 1},
+        )
+        self.add(grid)
+
+        # ======================================================
+        # 2. SIMULATE: MEAN + CI OF EVERY SAMPLE, IN CHUNKS
+        # ======================================================
+        population = pd.read_csv("Data/kvl_data.csv", index_col=False)["QoL"]
+        sample_size = 20
+        n_ladder = 40
+        # one vectorized pass per chunk => only mean + CI of each sample are kept
+        run = simulate_sampling(population, sample_size, n_samples=100000, seed=0)
+        mu = run.mu
+        # share of covering CIs after k = 1..n samples, read by the readout
+        coverage = np.cumsum(run.covers) / np.arange(1, len(run.covers) + 1)
+        print(f"mu = {mu:.2f}, coverage = {coverage[-1]:.3f}")
+
+        # ======================================================
+        # 3. ONE SCORE RANGE FOR THE LADDER AND THE HISTOGRAM
+        # ======================================================
+        layout = bin_layout(run.means, rule="fd")
+        lo = min(layout.edges[0], run.ci_low[:n_ladder].min())
+        hi = max(layout.edges[-1], run.ci_high[:n_ladder].max())
+        x_step = nice_step((hi - lo) / 6)
+        x_range = [
+            np.floor(lo / x_step) * x_step,
+            np.ceil(hi / x_step) * x_step,
+            x_step,
+        ]
+
+        ladder_axis = NumberLine(
+            x_range=x_range,
+            length=5.6,
+            include_numbers=True,
+            font_size=20,
+            color=GOLD_E,
+        ).move_to(LEFT * 3.6 + DOWN * 3)
+        axes = Axes(
+            x_range=x_range,
+            y_range=layout.y_range,
+            x_length=5.6,
+            y_length=4.4,
+            axis_config={"color": GOLD_E, "font_size": 20},
+            x_axis_config={"include_numbers": True},
+            y_axis_config={"include_numbers": True},
+            tips=False,
+        )
+        # same x as the ladder => a mean sits at the same score on both sides
+        x_axis_y = axes.x_axis.get_center()[1]
+        axes.shift(RIGHT * 3.6 + UP * (ladder_axis.get_center()[1] - x_axis_y))
+        ladder_label = Text(
+            f"Eerste {n_ladder} steekproeven (95% BI)", font_size=18, color=GOLD_A
+        ).next_to(ladder_axis, DOWN, buff=0.4)
+        hist_label = Text(
+            f"Gemiddelde per steekproef (n = {sample_size})", font_size=18, color=GOLD_A
+        ).next_to(axes.x_axis, DOWN, buff=0.4)
+        y_label = Text("Frequentie", font_size=18, color=GOLD_A).rotate(PI / 2)
+        y_label.next_to(axes.y_axis, LEFT, buff=0.5)
+        title = Text(
+            "Hoe vaak vangt het BI het populatiegemiddelde?", font_size=28, color=GOLD_A
+        )
+        title.to_edge(UP, buff=0.3)
+
+        self.play(Write(title))
+        self.play(
+            Create(ladder_axis),
+            Create(axes),
+            Write(ladder_label),
+            Write(hist_label),
+            Write(y_label),
+            run_time=2,
+        )
+
+        # the population mean => known here, because we made the population
+        ladder_top = ladder_axis.n2p(mu) + UP * (0.3 + 0.12 * n_ladder)
+        mu_line = DashedLine(ladder_axis.n2p(mu), ladder_top, color=GOLD_A)
+        mu_hist_line = DashedLine(
+            axes.c2p(mu, 0), axes.c2p(mu, layout.y_range[1]), color=GOLD_A
+        )
+        mu_label = MathTex(rf"\mu = {mu:.2f}", color=GOLD_A, font_size=26)
+        mu_label.next_to(mu_line, UP, buff=0.1)
+        self.play(Create(mu_line), Create(mu_hist_line), Write(mu_label))
+        self.wait(1)
+
+        # ======================================================
+        # 4. CI LADDER + LIVE HISTOGRAM OF THE MEANS
+        # ======================================================
+        # rung i => CI of sample i, blue if it covers mu, red if it misses
+        rungs = VGroup()
+        for i in range(n_ladder):
+            lift = UP * (0.3 + 0.12 * i)
+            color = BLUE if run.covers[i] else RED
+            rungs.add(
+                VGroup(
+                    Line(
+                        ladder_axis.n2p(run.ci_low[i]) + lift,
+                        ladder_axis.n2p(run.ci_high[i]) + lift,
+                        color=color,
+                        stroke_width=3,
+                    ),
+                    Dot(ladder_axis.n2p(run.means[i]) + lift, radius=0.03, color=color),
+                )
+            )
+
+        mean_hist = LiveHistogram(
+            layout.edges,
+            axes.x_axis,
+            axes.y_axis.get_unit_size(),
+            color=BLUE,
+            fill_opacity=0.7,
+            right=True,
+        )
+
+        # readout => samples drawn so far and the share of CIs covering mu
+        counter_label = Text("Steekproeven:", font_size=20, color=GOLD_A)
+        counter = DecimalNumber(0, num_decimal_places=0, color=GOLD_A, font_size=26)
+        counter.add_updater(lambda m: m.set_value(mean_hist.counts.sum()))
+        cover_label = Text("BI bevat μ:", font_size=20, color=GOLD_A)
+        cover = DecimalNumber(
+            0, num_decimal_places=1, unit=r"\%", color=GOLD_A, font_size=26
+        )
+
+        def covered_share(m):
+            k = int(mean_hist.counts.sum())
+            m.set_value(100 * coverage[k - 1] if k else 0)
+
+        cover.add_updater(covered_share)
+        readout = VGroup(
+            VGroup(counter_label, counter).arrange(RIGHT, buff=0.2),
+            VGroup(cover_label, cover).arrange(RIGHT, buff=0.2),
+        ).arrange(DOWN, aligned_edge=LEFT, buff=0.15)
+        readout.next_to(title, DOWN, buff=0.3).to_edge(RIGHT, buff=0.6)
+
+        self.add(mean_hist, readout)
+        # the ladder and the histogram get the first samples together, one by one
+        self.play(
+            LaggedStart(*[Create(rung) for rung in rungs], lag_ratio=1),
+            AccumulateValues(mean_hist, run.means[:n_ladder]),
+            run_time=12,
+            rate_func=linear,
+        )
+        self.wait(1)
+
+        # ======================================================
+        # 5. THE REST OF THE SAMPLES => COVERAGE SETTLES NEAR 95%
+        # ======================================================
+        self.play(
+            AccumulateValues(mean_hist, run.means[n_ladder:]),
+            run_time=12,
+            rate_func=linear,
+        )
+        self.wait(3)
+
+
+# source .venv/bin/activate
+# manim -qm --disable_caching DataTableTo_CI.py DataToCI
+# manim -qm --disable_caching DataTableTo_CI.py SamplingToCI
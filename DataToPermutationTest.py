@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+from manim import (
+    BLUE,
+    DOWN,
+    GOLD_A,
+    LEFT,
+    PI,
+    RED,
+    RIGHT,
+    UP,
+    Axes,
+    Create,
+    DashedLine,
+    DecimalNumber,
+    FadeIn,
+    MathTex,
+    NumberPlane,
+    Scene,
+    Text,
+    VGroup,
+    Write,
+    linear,
+)
+
+from HistLayout import bin_layout, nice_step
+from HistMobjects import AccumulateValues, LiveHistogram
+from Resampling import permutation_test
+
+
+class DataToPermutationTest(Scene):
+    def construct(self):
+        """
+        Is the difference between the two conditions real?
+          1) Shuffles the Conditie labels of the KvL scores 10000 times and keeps
+             the mean difference of every shuffle (the null distribution).
+          2) Lets that null distribution pile up as a histogram.
+          3) Marks the observed difference (and its mirror) and shows the p-value.
+        """
+
+        # ============= 1) BACKGROUND =============
+        grid = NumberPlane(
+            x_range=[-10, 10, 1],
+            y_range=[-10, 10, 1],
+            background_line_style={
+                "stroke_color": "#777777",
+                "stroke_width": 1,
+                "stroke_opacity": 0.5,
+            },
+            axis_config={"stroke_color": "#777777", "stroke_width": 1},
+        )
+        self.add(grid)
+
+        # ============= 2) LOAD DATA + PERMUTATION NULL =============
+        data = pd.read_csv("Data/kvl_skew_data.csv", index_col=False)
+        data.columns = ["ID", "Conditie", "KvL Score"]
+        data["Conditie"] = data["Conditie"].replace(
+            {"Mindfullness": "Mindfulness", "Short Walk": "Wandeling"}
+        )
+        levels = list(pd.unique(data["Conditie"]))
+        # all shuffles at once => batched argsort of random keys, fixed seed
+        test = permutation_test(
+            data["KvL Score"], data["Conditie"], n_permutations=10000, seed=0
+        )
+        observed = test.observed
+        print(f"observed: {observed:.3f}, p = {test.p_value:.4f}")
+
+        # ============= 3) AXES FROM THE NULL DISTRIBUTION =============
+        # bins + ranges from the data => both observed marks always on the axes
+        layout = bin_layout(np.append(test.null, [observed, -observed]), rule="fd")
+        # a tick per bin, numbers only at ~8 round values
+        x_min, x_max, bin_w = layout.x_range
+        x_step = max(bin_w, nice_step((x_max - x_min) / 8))
+        axes = Axes(
+            x_range=layout.x_range,
+            y_range=layout.y_range,
+            x_length=10,
+            y_length=4.5,
+            axis_config={"color": GOLD_A, "font_size": 20},
+            y_axis_config={"include_numbers": True},
+            tips=False,
+        )
+        axes.x_axis.add_numbers(
+            x_values=np.arange(np.ceil(x_min / x_step) * x_step, x_max + 1e-9, x_step)
+        )
+        axes.shift(DOWN * 0.6)
+        x_label = Text(
+            f"Verschil in gemiddelde KvL ({levels[0]} - {levels[1]})",
+            font_size=20,
+            color=GOLD_A,
+        ).next_to(axes.x_axis, DOWN, buff=0.5)
+        y_label = Text("Frequentie", font_size=20, color=GOLD_A).rotate(PI / 2)
+        y_label.next_to(axes.y_axis, LEFT, buff=0.5)
+        title = Text("Is het verschil echt?", font_size=30, color=GOLD_A)
+        title.to_edge(UP, buff=0.3)
+
+        self.play(Write(title))
+        self.play(Create(axes), Write(x_label), Write(y_label), run_time=3)
+        self.wait(1)
+
+        # ============= 4) OBSERVED DIFFERENCE =============
+        y_top = layout.y_range[1]
+        obs_line = DashedLine(
+            axes.c2p(observed, 0), axes.c2p(observed, y_top), color=RED
+        )
+        mirror_line = DashedLine(
+            axes.c2p(-observed, 0),
+            axes.c2p(-observed, y_top),
+            color=RED,
+            stroke_opacity=0.5,
+        )
+        obs_label = MathTex(
+            rf"\mathit{{verschil}} = {observed:.2f}", color=RED, font_size=24
+        ).next_to(obs_line, UP, buff=0.1)
+        self.play(Create(obs_line), Write(obs_label))
+        self.wait(1)
+
+        # ============= 5) NULL HISTOGRAM PILES UP =============
+        # one bar per bin from the start => each frame only reshapes changed bins
+        null_hist = LiveHistogram(
+            layout.edges,
+            axes.x_axis,
+            axes.y_axis.get_unit_size(),
+            color=BLUE,
+            fill_opacity=0.7,
+            right=True,
+        )
+        counter_label = Text("Permutaties:", font_size=20, color=GOLD_A)
+        counter = DecimalNumber(0, num_decimal_places=0, color=GOLD_A, font_size=26)
+        counter.add_updater(lambda m: m.set_value(null_hist.counts.sum()))
+        counter_group = VGroup(counter_label, counter).arrange(RIGHT, buff=0.2)
+        counter_group.next_to(title, DOWN, buff=0.3).to_edge(RIGHT, buff=0.8)
+
+        self.add(null_hist, counter_group)
+        # slowly at first => the first 200 shuffles, then the rest
+        self.play(AccumulateValues(null_hist, test.null[:200]), run_time=5)
+        self.play(
+            AccumulateValues(null_hist, test.null[200:]), run_time=8, rate_func=linear
+        )
+        self.wait(1)
+
+        # ============= 6) AS EXTREME AS OBSERVED => P-VALUE =============
+        midpoints = layout.midpoints
+        extreme_bars = [
+            bar
+            for bar, mid, count in zip(null_hist, midpoints, null_hist.counts)
+            if count > 0 and abs(mid) >= abs(observed)
+        ]
+        self.play(
+            Create(mirror_line),
+            *[bar.animate.set_color(RED) for bar in extreme_bars],
+            run_time=2,
+        )
+        p_text = MathTex(rf"p = {test.p_value:.3f}", color=RED, font_size=36)
+        p_text.next_to(counter_group, DOWN, buff=0.3, aligned_edge=RIGHT)
+        self.play(FadeIn(p_text))
+        self.wait(3)
+
+
+# source .venv/bin/activate
+# manim -qm --disable_caching DataToPermutationTest.py DataToPermutationTest
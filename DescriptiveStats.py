@@ -0,0 +1,272 @@
+import heapq
+from collections import namedtuple
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# Summary statistics of a numeric column per group, for the stats blocks and
+# mean / median markers of the histogram scenes. No manim dependency.
+
+# sd is the sample SD (ddof=1), skew the adjusted Fisher-Pearson skewness
+# (what pandas' .skew() reports), se = sd / sqrt(n), and [ci_low, ci_high]
+# the t-based confidence interval of the mean.
+GroupStats = namedtuple(
+    "GroupStats", ["n", "mean", "median", "sd", "skew", "se", "ci_low", "ci_high"]
+)
+
+
+# Two-sided t critical values are tabulated for df = 1..T_TABLE_DF per
+# confidence level; beyond that a Cornish-Fisher expansion is used.
+T_TABLE_DF = 1000
+_t_tables = {}
+
+
+def t_table(confidence=0.95):
+    """t critical values indexed by df (0..T_TABLE_DF, NaN at 0), built once.
+
+    scipy is called once per confidence level, for the whole table; every
+    later lookup is plain indexing.
+    """
+    table = _t_tables.get(confidence)
+    if table is None:
+        df = np.arange(T_TABLE_DF + 1)
+        table = stats.t.ppf((1 + confidence) / 2, np.maximum(df, 1))
+        table[0] = np.nan
+        table.setflags(write=False)
+        _t_tables[confidence] = table
+    return table
+
+
+def t_expansion(df, confidence=0.95):
+    """Cornish-Fisher expansion of the t critical value in powers of 1 / df.
+
+    Starts from the normal quantile z; with four correction terms the
+    error is below 1e-10 for df > 1000, where the table stops.
+    """
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    v = np.asarray(df, dtype=float)
+    return (
+        z
+        + (z**3 + z) / (4 * v)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * v**2)
+        + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * v**3)
+        + (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z)
+        / (92160 * v**4)
+    )
+
+
+def t_critical(df, confidence=0.95):
+    """Two-sided t critical value for ``df`` (scalar or array), NaN for df < 1."""
+    df = np.asarray(df, dtype=int)
+    values = t_table(confidence)[np.clip(df, 0, T_TABLE_DF)]
+    large = df > T_TABLE_DF
+    if large.any():
+        values = np.where(large, t_expansion(np.maximum(df, 1), confidence), values)
+    return values
+
+
+def ci_margin(sd, n, confidence=0.95):
+    """Half-width ``t * sd / sqrt(n)`` of the CI of the mean, NaN for n < 2."""
+    n = np.asarray(n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return t_critical(n - 1, confidence) * sd / np.sqrt(n)
+
+
+def _spread(n, m2, m3, confidence):
+    """sd, skew, se and CI margin from n and the central moments m2, m3.
+
+    ``m2`` and ``m3`` are population moments (divided by n). Works on
+    scalars and arrays alike; undefined entries (n < 2, or n < 3 for the
+    skewness) are NaN.
+    """
+    n = np.asarray(n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sd = np.where(n > 1, np.sqrt(m2 * n / (n - 1)), np.nan)
+        skew = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2**1.5
+        skew = np.where(n > 2, np.where(m2 > 0, skew, 0.0), np.nan)
+        se = sd / np.sqrt(n)
+    return sd, skew, se, ci_margin(sd, n, confidence)
+
+
+def grouped_stats(values, groups, confidence=0.95):
+    """GroupStats of ``values`` per level of ``groups``, as a dict.
+
+    The levels keep their order of first appearance; NaN values and groups
+    are left out. The values are sorted once by (group, value), so every
+    group is one contiguous, sorted run: sums and central moments are one
+    ``np.add.reduceat`` over the runs, and each median is read off the
+    middle of its run.
+    """
+    values = np.asarray(values, dtype=float)
+    codes, levels = pd.factorize(np.asarray(groups), sort=False)
+    keep = (codes >= 0) & ~np.isnan(values)
+    order = np.lexsort((values[keep], codes[keep]))
+    x = values[keep][order]
+    g = codes[keep][order]
+
+    n = np.bincount(g, minlength=len(levels))
+    starts = np.cumsum(n) - n
+    present = n > 0
+    runs = starts[present]
+
+    def run_sums(column):
+        sums = np.zeros(len(levels))
+        if len(column):
+            sums[present] = np.add.reduceat(column, runs)
+        return sums
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = run_sums(x) / n
+        deviations = x - mean[g]
+        m2 = run_sums(deviations**2) / n
+        m3 = run_sums(deviations**3) / n
+    sd, skew, se, margin = _spread(n, m2, m3, confidence)
+
+    median = np.full(len(levels), np.nan)
+    lower = runs + (n[present] - 1) // 2
+    upper = runs + n[present] // 2
+    median[present] = (x[lower] + x[upper]) / 2
+
+    return {
+        level: GroupStats(
+            int(n[i]),
+            float(mean[i]),
+            float(median[i]),
+            float(sd[i]),
+            float(skew[i]),
+            float(se[i]),
+            float(mean[i] - margin[i]),
+            float(mean[i] + margin[i]),
+        )
+        for i, level in enumerate(levels)
+    }
+
+
+def running_estimates(values, confidence=0.95):
+    """GroupStats of the first k values for every k = 1..n, as a DataFrame.
+
+    One row per k, indexed by k, so a scene can read the estimates at any
+    frame by position and the table can go straight to ``to_csv``. The
+    moments come from cumulative sums of x, x**2 and x**3 (taken around the
+    first value, which keeps the sums small), the medians from one
+    RunningMedian fed in order.
+    """
+    x = np.asarray(values, dtype=float)
+    k = np.arange(1, len(x) + 1)
+    origin = x[0] if len(x) else 0.0
+    d = x - origin
+    s1, s2, s3 = np.cumsum(d), np.cumsum(d**2), np.cumsum(d**3)
+    mean_d = s1 / k
+    m2 = np.maximum(s2 / k - mean_d**2, 0.0)
+    m3 = s3 / k - 3 * mean_d * s2 / k + 2 * mean_d**3
+    sd, skew, se, margin = _spread(k, m2, m3, confidence)
+    mean = origin + mean_d
+
+    running_median = RunningMedian()
+    median = np.array([running_median.add(value).median for value in x])
+
+    return pd.DataFrame(
+        {
+            "n": k,
+            "mean": mean,
+            "median": median,
+            "sd": sd,
+            "skew": skew,
+            "se": se,
+            "ci_low": mean - margin,
+            "ci_high": mean + margin,
+        },
+        index=pd.Index(k, name="k"),
+    )
+
+
+class RunningMedian:
+    """Median of a stream of values from two heaps, O(log n) per value.
+
+    The lower half sits in a max-heap, the upper half in a min-heap, and
+    the lower half is never smaller than the upper one, so the median is
+    the top of the lower heap or the mean of both tops.
+    """
+
+    def __init__(self):
+        self.lower = []  # negated, so heapq's min-heap acts as a max-heap
+        self.upper = []
+
+    def add(self, value):
+        if not self.lower or value <= -self.lower[0]:
+            heapq.heappush(self.lower, -value)
+        else:
+            heapq.heappush(self.upper, value)
+        # keep len(lower) == len(upper) or len(upper) + 1
+        if len(self.lower) > len(self.upper) + 1:
+            heapq.heappush(self.upper, -heapq.heappop(self.lower))
+        elif len(self.upper) > len(self.lower):
+            heapq.heappush(self.lower, -heapq.heappop(self.upper))
+        return self
+
+    @property
+    def median(self):
+        if not self.lower:
+            return np.nan
+        if len(self.lower) > len(self.upper):
+            return -self.lower[0]
+        return (-self.lower[0] + self.upper[0]) / 2
+
+
+class RunningStats:
+    """GroupStats of a stream of values, updated one value at a time.
+
+    The moments use Welford's update (extended to the third moment), so
+    ``add`` is O(1) and never revisits earlier values; the median comes from
+    a RunningMedian, so ``add`` stays O(log n). ``snapshot`` returns the same record as
+    ``grouped_stats`` for everything added so far.
+    """
+
+    def __init__(self, values=(), confidence=0.95):
+        self.confidence = confidence
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared deviations from the mean
+        self.m3 = 0.0  # sum of cubed deviations from the mean
+        self.running_median = RunningMedian()
+        self.extend(values)
+
+    def add(self, value):
+        value = float(value)
+        n_before = self.n
+        self.n += 1
+        delta = value - self.mean
+        delta_n = delta / self.n
+        term = delta * delta_n * n_before
+        self.mean += delta_n
+        self.m3 += term * delta_n * (self.n - 2) - 3 * delta_n * self.m2
+        self.m2 += term
+        self.running_median.add(value)
+        return self
+
+    def extend(self, values):
+        for value in values:
+            self.add(value)
+        return self
+
+    @property
+    def median(self):
+        return self.running_median.median
+
+    def snapshot(self):
+        n = self.n
+        m2, m3 = (self.m2 / n, self.m3 / n) if n else (np.nan, np.nan)
+        sd, skew, se, margin = _spread(n, m2, m3, self.confidence)
+        mean = self.mean if n else np.nan
+        return GroupStats(
+            n,
+            float(mean),
+            float(self.median),
+            float(sd),
+            float(skew),
+            float(se),
+            float(mean - margin),
+            float(mean + margin),
+        )
@@ -0,0 +1,205 @@
+import numpy as np
+from manim import (
+    WHITE,
+    Animation,
+    ManimColor,
+    PMobject,
+    color_to_rgba,
+    config,
+    linear,
+    smooth,
+)
+
+
+def smooth_array(alphas, inflection=10.0):
+    """manim's ``smooth`` for a whole array of alphas at once."""
+    t = np.clip(np.asarray(alphas, dtype=float), 0, 1)
+    error = 1 / (1 + np.exp(inflection / 2))
+    sigmoid = 1 / (1 + np.exp(-inflection * (t - 0.5)))
+    return np.clip((sigmoid - error) / (1 - 2 * error), 0, 1)
+
+
+# NumPy versions of manim's rate functions => no per-dot Python calls
+ARRAY_RATES = {smooth: smooth_array}
+
+
+def vectorized_rate(rate_func):
+    """Apply ``rate_func`` to an array of alphas.
+
+    Rate functions with a NumPy version in ARRAY_RATES use it. The others
+    are written for scalars (``unit_interval`` compares ``t`` with 0 and 1,
+    others clamp with min/max), so they are only called on the whole array
+    when that works, and once per alpha otherwise.
+    """
+    if rate_func in ARRAY_RATES:
+        return ARRAY_RATES[rate_func]
+
+    def apply(alphas):
+        try:
+            values = np.asarray(rate_func(alphas), dtype=float)
+        except (TypeError, ValueError):
+            values = None
+        if values is None or values.shape != alphas.shape:
+            values = np.vectorize(rate_func, otypes=[float])(alphas)
+        return values
+
+    return apply
+
+
+def arc_points(starts, ends, alphas, height=1.5, direction=(0, 1, 0)):
+    """Points on the quadratic Bezier arcs from ``starts`` to ``ends`` at ``alphas``.
+
+    The control point sits ``height`` above the midpoint of each pair, the
+    same arc the scenes drew with a ParametricFunction. Works for one arc
+    (points of shape (3,)) or many ((N, 3) with N alphas) in a single call.
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    a = np.asarray(alphas, dtype=float)[..., None]
+    controls = (starts + ends) / 2 + height * np.asarray(direction, dtype=float)
+    return (1 - a) ** 2 * starts + 2 * (1 - a) * a * controls + a**2 * ends
+
+
+def color_rgbas(colors, n):
+    """(n, 4) rgba array for one color or a per-dot sequence of colors."""
+    # ManimColor supports indexing, so np.iterable alone would split it up
+    if isinstance(colors, (str, ManimColor)) or not np.iterable(colors):
+        return np.repeat([color_to_rgba(colors)], n, axis=0)
+    names = np.asarray([str(c) for c in colors])
+    unique, inverse = np.unique(names, return_inverse=True)
+    return np.array([color_to_rgba(c) for c in unique])[inverse]
+
+
+class DotCloud(PMobject):
+    """Many equal dots drawn as one point-cloud mobject.
+
+    The dots live in an (N, 3) ``positions`` array and an (N, 4) ``colors``
+    array, and the camera draws all of them in one vectorized pass, so a
+    frame costs about the same for 100 or 50k dots. Each dot is a square of
+    ``2 * radius`` scene units. Point clouds are drawn without blending,
+    so a hidden dot is left out of the drawn points instead of being made
+    transparent.
+    """
+
+    def __init__(self, positions, colors=WHITE, radius=0.05, **kwargs):
+        self.radius = radius
+        pixels = 2 * radius * config.pixel_width / config.frame_width
+        super().__init__(stroke_width=max(1, round(pixels)), **kwargs)
+        self.positions = np.asarray(positions, dtype=float).reshape(-1, 3).copy()
+        self.colors = color_rgbas(colors, len(self.positions))
+        self.visible = np.ones(len(self.positions), dtype=bool)
+        self.sync_points()
+
+    def sync_points(self):
+        self.points = self.positions[self.visible]
+        self.rgbas = self.colors[self.visible]
+        return self
+
+    def get_positions(self):
+        return self.positions
+
+    def set_positions(self, positions):
+        self.positions[:] = positions
+        return self.sync_points()
+
+    def set_visible(self, mask):
+        self.visible = np.asarray(mask, dtype=bool).copy()
+        return self.sync_points()
+
+
+class ArcFlight(Animation):
+    """Move ``mobject`` along an arc from ``start`` to ``end``.
+
+    The position is evaluated from the Bezier formula at every frame, so no
+    path mobject is built just to be followed.
+    """
+
+    def __init__(self, mobject, start, end, height=1.5, **kwargs):
+        self.start = np.asarray(start, dtype=float)
+        self.end = np.asarray(end, dtype=float)
+        self.height = height
+        super().__init__(mobject, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.move_to(arc_points(self.start, self.end, alpha, self.height))
+
+
+class BulkFlight(Animation):
+    """Fly many dots from ``starts`` to ``ends`` in one animation.
+
+    ``starts`` and ``ends`` are (N, 3) arrays; dot k leaves at ``offsets[k]``
+    seconds and arrives ``flight_time`` seconds later, eased by
+    ``local_rate_func``, on a straight line or (``arc_height``) an arc. The
+    default schedule (one dot after the other) reproduces a play() per dot,
+    but every frame is a single array update.
+    Dots are hidden until they take off, as if they were added on launch.
+    ``dots`` is a VGroup of dots or a DotCloud; for a cloud the positions are
+    written as one array and no Python work is done per dot.
+    """
+
+    def __init__(
+        self,
+        dots,
+        starts,
+        ends,
+        offsets=None,
+        flight_time=0.2,
+        local_rate_func=smooth,
+        arc_height=0,
+        **kwargs,
+    ):
+        self.starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+        self.ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+        n = len(self.starts)
+        if offsets is None:
+            offsets = flight_time * np.arange(n)
+        self.offsets = np.asarray(offsets, dtype=float)
+        self.flight_time = flight_time
+        self.arc_height = arc_height
+        self.local_rate = vectorized_rate(local_rate_func)
+        total = float(self.offsets.max() + flight_time) if n else flight_time
+        kwargs.setdefault("run_time", total)
+        kwargs.setdefault("rate_func", linear)
+        self.total_time = total
+        super().__init__(dots, **kwargs)
+
+    def begin(self):
+        self.is_cloud = isinstance(self.mobject, DotCloud)
+        if self.is_cloud:
+            self.shown = self.mobject.visible.copy()
+            self.mobject.set_positions(self.starts)
+            self.mobject.set_visible(np.zeros(len(self.starts), dtype=bool))
+        else:
+            self.shown = [dot.get_fill_opacity() for dot in self.mobject]
+            for dot, start in zip(self.mobject, self.starts):
+                dot.move_to(start).set_fill(opacity=0)
+        self.launched = np.zeros(len(self.starts), dtype=bool)
+        self.positions = self.starts.copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        t = alpha * self.total_time
+        local = np.clip((t - self.offsets) / self.flight_time, 0, 1)
+        eased = self.local_rate(local)
+        positions = arc_points(self.starts, self.ends, eased, self.arc_height)
+
+        launched = t >= self.offsets
+        if self.is_cloud:
+            self.mobject.visible = launched & self.shown
+            self.mobject.set_positions(positions)
+        else:
+            # only dots whose launch state changed this frame are recolored
+            for k in np.flatnonzero(launched != self.launched):
+                self.mobject[k].set_fill(opacity=self.shown[k] if launched[k] else 0)
+            for dot, shift in zip(self.mobject, positions - self.positions):
+                dot.points += shift
+        self.launched = launched
+        self.positions = positions
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        if self.is_cloud:
+            self.mobject.set_visible(self.shown)
+        else:
+            for dot, opacity in zip(self.mobject, self.shown):
+                dot.set_fill(opacity=opacity)
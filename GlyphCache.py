@@ -0,0 +1,41 @@
+from manim import Text
+
+# Parsed Text prototypes keyed by (string, color, font, scale, extra Text kwargs).
+_glyphs = {}
+_stats = {"hits": 0, "misses": 0}
+
+
+def cached_text(text, color=None, font="", scale=1.0, **text_kwargs):
+    """Return ``Text(text, color=color, font=font, **text_kwargs).scale(scale)``.
+
+    Only the first request for a key goes through Pango and the SVG parser;
+    every later request gets a copy of the already-parsed glyph geometry.
+    Copies are independent, so callers may move, recolor or transform them.
+    """
+    key = (
+        str(text),
+        str(color),
+        font,
+        scale,
+        tuple(sorted(text_kwargs.items())),
+    )
+    prototype = _glyphs.get(key)
+    if prototype is None:
+        _stats["misses"] += 1
+        prototype = Text(str(text), color=color, font=font, **text_kwargs)
+        prototype.scale(scale)
+        _glyphs[key] = prototype
+    else:
+        _stats["hits"] += 1
+    return prototype.copy()
+
+
+def glyph_cache_info():
+    """Hit/miss counters and number of distinct glyph strings held."""
+    return {"hits": _stats["hits"], "misses": _stats["misses"], "size": len(_glyphs)}
+
+
+def clear_glyph_cache():
+    _glyphs.clear()
+    _stats["hits"] = 0
+    _stats["misses"] = 0
@@ -0,0 +1,182 @@
+from collections import namedtuple
+from itertools import pairwise
+
+import numpy as np
+
+# Layout of dots and bars for the histogram scenes. Everything here works
+# on whole columns at once and has no manim dependency, so the scenes only
+# look positions up while animating.
+#
+# Bins are integer codes into one shared edges / midpoints array: code b is
+# the bin (edges[b], edges[b + 1]), and -1 means "no bin". Labels such as
+# "70-75" are only formatted for display, never used as keys.
+
+
+# Edges, codes and per-(group, bin) counts of one binned column, plus the
+# axis ranges that fit them: x_range = [first edge, last edge, bin width] and
+# y_range = [0, top, step] in counts.
+BinLayout = namedtuple(
+    "BinLayout", ["edges", "midpoints", "codes", "counts", "x_range", "y_range"]
+)
+
+
+def nice_step(raw, steps=(1, 2, 2.5, 5)):
+    """Smallest ``step * 10**k`` (for a step in ``steps``) that is >= ``raw``."""
+    if not raw > 0:
+        return float(steps[0])
+    power = 10.0 ** np.floor(np.log10(raw))
+    for step in (*steps, 10):
+        if step * power >= raw * (1 - 1e-9):
+            return float(step * power)
+
+
+def bin_width(values, rule="fd"):
+    """Raw bin width of ``values`` by rule: "sturges" or "fd" (Freedman-Diaconis).
+
+    Sturges splits the range into ``log2(n) + 1`` bins; Freedman-Diaconis
+    uses ``2 * IQR / n ** (1/3)`` and falls back to Sturges when the IQR is 0.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    n = len(values)
+    spread = values.max() - values.min() if n else 0.0
+    if rule == "fd":
+        q1, q3 = np.percentile(values, [25, 75]) if n else (0.0, 0.0)
+        if q3 > q1:
+            return 2 * (q3 - q1) / n ** (1 / 3)
+    elif rule != "sturges":
+        raise ValueError(f"unknown binning rule: {rule!r}")
+    return spread / (np.ceil(np.log2(n)) + 1) if n else 0.0
+
+
+def bin_edges(values, rule="fd", width=None, right=True):
+    """Edges of equal-width bins covering ``values``.
+
+    ``rule`` is "sturges", "fd" or "fixed" (which needs ``width``). The width
+    of the other rules is rounded up to a nice step, and the edges sit on
+    multiples of it, so bin labels stay short. The outer edges are the
+    nearest multiples around the data, leaving no empty bins at either end;
+    with ``right`` (bins closed on the right) the first edge stays below the
+    minimum, which would otherwise fall outside every bin.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if rule == "fixed":
+        if width is None:
+            raise ValueError('rule "fixed" needs a width')
+    else:
+        width = nice_step(bin_width(values, rule))
+    lo, hi = (values.min(), values.max()) if len(values) else (0.0, width)
+    if right:
+        first = np.ceil(lo / width) - 1
+        last = max(np.ceil(hi / width), first + 1)
+    else:
+        first = np.floor(lo / width)
+        last = max(np.floor(hi / width) + 1, first + 1)
+    return np.arange(first, last + 0.5) * width
+
+
+def bin_layout(values, groups=None, rule="fd", width=None, right=True, y_ticks=5):
+    """Bin ``values`` and size the axes to the result in one pass.
+
+    ``counts`` has one row per group (in ``np.unique`` order, a single row
+    without ``groups``). The y-axis runs to one step above the highest
+    count, with an integer step that gives about ``y_ticks`` ticks.
+    """
+    edges = bin_edges(values, rule, width, right)
+    codes = bin_codes(values, edges, right)
+    n_bins = len(edges) - 1
+    if groups is None:
+        group_codes = np.zeros(len(codes), dtype=int)
+    else:
+        group_codes = np.unique(np.asarray(groups), return_inverse=True)[1]
+    n_groups = group_codes.max() + 1 if len(codes) else 1
+    keys = stack_keys(codes, group_codes.reshape(-1), n_bins)
+    counts = stack_counts(keys, n_groups * n_bins).reshape(n_groups, n_bins)
+    top = int(counts.max())
+    y_step = max(1, int(nice_step(top / y_ticks, steps=(1, 2, 5))))
+    y_top = y_step * int(np.ceil((top + 1) / y_step))
+    return BinLayout(
+        edges,
+        bin_midpoints(edges),
+        codes,
+        counts,
+        [float(edges[0]), float(edges[-1]), float(edges[1] - edges[0])],
+        [0, y_top, y_step],
+    )
+
+
+def bin_codes(values, edges, right=True):
+    """Bin code of every value, -1 outside the edges or for NaN.
+
+    With ``right`` the bins are closed on the right, like ``pd.cut``'s
+    default; otherwise they are closed on the left, the last one on both
+    sides, like ``np.histogram``.
+    """
+    values = np.atleast_1d(np.asarray(values, dtype=float))
+    edges = np.asarray(edges, dtype=float)
+    n_bins = len(edges) - 1
+    if right:
+        codes = np.searchsorted(edges, values, side="left") - 1
+    else:
+        codes = np.searchsorted(edges, values, side="right") - 1
+        codes[values == edges[-1]] = n_bins - 1
+    codes[(codes < 0) | (codes >= n_bins) | np.isnan(values)] = -1
+    return codes
+
+
+def bin_midpoints(edges):
+    edges = np.asarray(edges, dtype=float)
+    return (edges[:-1] + edges[1:]) / 2
+
+
+def bin_label_texts(edges):
+    """Label "a-b" of every bin, e.g. "0-5", "5-10", ... for edges 0, 5, 10, ..."""
+    return [f"{a:g}-{b:g}" for a, b in pairwise(edges)]
+
+
+def stack_keys(codes, group_codes, n_bins):
+    """One integer per (group, bin): ``group * n_bins + bin``, -1 if either is -1."""
+    codes = np.asarray(codes)
+    group_codes = np.asarray(group_codes)
+    keys = group_codes * n_bins + codes
+    keys[(codes < 0) | (group_codes < 0)] = -1
+    return keys
+
+
+def stack_indices(keys):
+    """1-based height of every row in the stack of its key, in row order.
+
+    A grouped cumulative count: the first row of a key gets 1, the next
+    one 2, and so on, which is the order the scenes drop the dots in. A
+    stable sort groups equal keys without reordering them.
+    """
+    keys = np.asarray(keys)
+    n = len(keys)
+    if n == 0:
+        return np.zeros(0, dtype=int)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    firsts = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+    # position (in sorted order) of the first row of each row's key
+    group_start = np.maximum.accumulate(np.where(firsts, np.arange(n), 0))
+    indices = np.empty(n, dtype=int)
+    indices[order] = np.arange(n) - group_start + 1
+    return indices
+
+
+def stack_targets(base_points, stack_index, step, direction=(0, 1, 0)):
+    """(N, 3) dot positions: ``stack_index`` steps of ``step`` above ``base_points``.
+
+    ``base_points`` are the (N, 3) axis points under each dot, e.g. from a
+    NumberLine's ``n2p`` applied to the whole midpoint column.
+    """
+    base_points = np.asarray(base_points, dtype=float).reshape(-1, 3)
+    offsets = np.outer(np.asarray(stack_index, dtype=float) * step, direction)
+    return base_points + offsets
+
+
+def stack_counts(keys, n_keys):
+    """Final stack height of every key (0 for empty ones), as an array."""
+    keys = np.asarray(keys)
+    return np.bincount(keys[keys >= 0], minlength=n_keys)
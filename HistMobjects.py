@@ -0,0 +1,336 @@
+import numpy as np
+import pandas as pd
+from manim import (
+    DEGREES,
+    DOWN,
+    GOLD_A,
+    LEFT,
+    RIGHT,
+    WHITE,
+    Animation,
+    Axes,
+    ManimColor,
+    VGroup,
+    VMobject,
+    interpolate,
+)
+
+from GlyphCache import cached_text
+from HistLayout import bin_codes, bin_label_texts, bin_midpoints
+
+# Rotated bin labels per (edges, color, font size, angle), shared by every BinnedAxes.
+_bin_labels = {}
+
+# Control-point offset that makes four cubic curves a circle.
+CIRCLE_KAPPA = 4 * (np.sqrt(2) - 1) / 3
+
+
+def circle_quads(centers, radius):
+    """(16 * N, 3) Bezier points of N circles, each as four quarter arcs.
+
+    The arcs run counterclockwise from the rightmost point, so each quad
+    lines up with one edge of the matching ``slab_quads`` rectangle.
+    """
+    centers = np.asarray(centers, dtype=float).reshape(-1, 1, 3)
+    quarter = np.array([[1, 0], [1, CIRCLE_KAPPA], [CIRCLE_KAPPA, 1], [0, 1]])
+    # the other three quarters => the first one turned by 90, 180, 270 degrees
+    turn = np.array([[0, 1], [-1, 0]])
+    quarters = [quarter]
+    for _ in range(3):
+        quarters.append(quarters[-1] @ turn)
+    unit = np.concatenate(quarters)
+    offsets = np.column_stack([radius * unit, np.zeros(len(unit))])
+    return (centers + offsets).reshape(-1, 3)
+
+
+def slab_quads(bottoms, width, height):
+    """(16 * N, 3) Bezier points of N rectangles standing on ``bottoms``.
+
+    The edges are ordered right, top, left, bottom, matching the circle arcs
+    that start at angles 0, 90, 180 and 270 degrees.
+    """
+    bottoms = np.asarray(bottoms, dtype=float).reshape(-1, 1, 3)
+    w, h = width / 2, height
+    corners = np.array([[w, 0], [w, h], [-w, h], [-w, 0], [w, 0]], dtype=float)
+    thirds = np.array([0, 1 / 3, 2 / 3, 1])[:, None]
+    # each edge as a straight cubic => anchors and handles at thirds
+    starts, ends = corners[:-1, None, :], corners[1:, None, :]
+    unit = (starts + thirds * (ends - starts)).reshape(-1, 2)
+    offsets = np.column_stack([unit, np.zeros(len(unit))])
+    return (bottoms + offsets).reshape(-1, 3)
+
+
+class DotBarHistogram(VGroup):
+    """Stacked dots that turn into histogram bars as ``morph`` goes from 0 to 1.
+
+    Bin ``b`` stands on ``base_points[b]`` and holds ``counts[b]`` dots; dot
+    ``k`` (from 1) is centred ``k * step`` above the base, the same spot the
+    scenes stack their dots on. Every dot is the start of its own slab of the
+    bar, so both shapes are computed once and any frame in between is a
+    linear blend of two arrays, with no point alignment.
+    """
+
+    def __init__(
+        self,
+        base_points,
+        counts,
+        step,
+        bar_width,
+        colors=WHITE,
+        dot_radius=0.05,
+        bar_opacity=0.8,
+        morph=0,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        base_points = np.asarray(base_points, dtype=float).reshape(-1, 3)
+        self.counts = np.asarray(counts, dtype=int)
+        self.step = step
+        self.bar_opacity = bar_opacity
+        if isinstance(colors, (str, ManimColor)) or not np.iterable(colors):
+            colors = [colors] * len(self.counts)
+
+        up = np.array([0, step, 0])
+        self.dot_points = []
+        self.bar_points = []
+        for base, count, color in zip(base_points, self.counts, colors):
+            heights = np.arange(1, count + 1)[:, None]
+            self.dot_points.append(circle_quads(base + heights * up, dot_radius))
+            bottoms = base + (heights - 1) * up
+            self.bar_points.append(slab_quads(bottoms, bar_width, step))
+            self.add(VMobject(fill_color=color, fill_opacity=1, stroke_width=0))
+        self.set_morph(morph)
+
+    def get_morph(self):
+        return self.morph
+
+    def set_morph(self, morph):
+        self.morph = morph
+        opacity = interpolate(1, self.bar_opacity, morph)
+        shapes = zip(self.submobjects, self.dot_points, self.bar_points)
+        for bin_mob, dots, bars in shapes:
+            bin_mob.set_points(dots + morph * (bars - dots))
+            bin_mob.set_fill(opacity=opacity)
+        return self
+
+
+class HistogramMorph(Animation):
+    """Drive a DotBarHistogram's ``morph`` from its current value to ``morph``."""
+
+    def __init__(self, histogram, morph=1, **kwargs):
+        self.start_morph = histogram.get_morph()
+        self.end_morph = morph
+        super().__init__(histogram, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_morph(interpolate(self.start_morph, self.end_morph, alpha))
+
+
+class LiveHistogram(VGroup):
+    """Histogram bars over fixed bins that follow a counts array.
+
+    ``edges`` are the bin edges in axis units and ``axis`` is the NumberLine
+    the bars stand on; one count is ``step`` scene units tall. Every bin owns
+    one bar mobject from the start, and ``add_values`` / ``remove_values``
+    only reshape the bars whose count changed, so samples can stream in
+    without new mobjects. Bins are closed on the left (the last one on both
+    sides) unless ``right`` is set, which matches ``pd.cut(..., right=True)``.
+    """
+
+    def __init__(
+        self,
+        edges,
+        axis,
+        step,
+        bar_width=None,
+        color=WHITE,
+        fill_opacity=0.7,
+        right=False,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.edges = np.asarray(edges, dtype=float)
+        self.step = step
+        self.right = right
+        self.counts = np.zeros(len(self.edges) - 1, dtype=int)
+        centers = bin_midpoints(self.edges)
+        self.bases = axis.n2p(centers).reshape(-1, 3)
+        if bar_width is None:
+            first = axis.n2p(self.edges[:2])
+            bar_width = first[1][0] - first[0][0]
+        self.bar_width = bar_width
+        for _ in centers:
+            bar = VMobject(stroke_color=color, fill_color=color)
+            self.add(bar.set_fill(opacity=fill_opacity))
+
+    def bin_codes(self, values):
+        """Bin index of every value, -1 for values outside the edges."""
+        return bin_codes(values, self.edges, self.right)
+
+    def get_count(self, value):
+        code = self.bin_codes(value)[0]
+        return int(self.counts[code]) if code >= 0 else 0
+
+    def get_counts(self):
+        return self.counts.copy()
+
+    def add_values(self, values):
+        return self.update_counts(values, 1)
+
+    def remove_values(self, values):
+        return self.update_counts(values, -1)
+
+    def update_counts(self, values, sign=1):
+        codes = self.bin_codes(values)
+        delta = np.bincount(codes[codes >= 0], minlength=len(self.counts))
+        changed = np.flatnonzero(delta)
+        counts = self.counts[changed] + sign * delta[changed]
+        self.counts[changed] = np.maximum(counts, 0)
+        for b in changed:
+            self.resize_bar(b)
+        return self
+
+    def resize_bar(self, b):
+        bar = self.submobjects[b]
+        if self.counts[b] == 0:
+            bar.reset_points()
+        else:
+            height = self.counts[b] * self.step
+            bar.set_points(slab_quads(self.bases[b], self.bar_width, height))
+        return bar
+
+
+class AccumulateValues(Animation):
+    """Stream ``values`` into a LiveHistogram, in order, over the animation.
+
+    At every frame the first ``alpha * len(values)`` values are in; the new
+    ones since the last frame go in with one ``add_values`` call (or out
+    with ``remove_values`` if the rate function runs backwards), so a frame
+    only reshapes the bins that changed.
+    """
+
+    def __init__(self, histogram, values, **kwargs):
+        self.values = np.asarray(values, dtype=float)
+        self.n_added = 0
+        super().__init__(histogram, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        target = round(alpha * len(self.values))
+        if target > self.n_added:
+            self.mobject.add_values(self.values[self.n_added : target])
+        elif target < self.n_added:
+            self.mobject.remove_values(self.values[target : self.n_added])
+        self.n_added = target
+
+
+def bin_label_glyphs(edges, color, font_size, angle):
+    """Rotated bin labels, built once per process and copied by every caller."""
+    key = (tuple(edges), str(color), font_size, angle)
+    labels = _bin_labels.get(key)
+    if labels is None:
+        labels = VGroup(
+            *[
+                cached_text(text, color, font_size=font_size).rotate(angle)
+                for text in bin_label_texts(edges)
+            ]
+        )
+        _bin_labels[key] = labels
+    return labels.copy()
+
+
+class BinnedAxes(Axes):
+    """Histogram axes whose x-axis is labelled per bin of ``edges``.
+
+    The x-axis has a tick on every edge and an "a-b" label under every bin
+    midpoint; the y-axis is labelled at ``y_numbers``. Axes is asked for no
+    numbers at all, and the labels come from the shared glyph caches, so a
+    second (third, ...) axes over the same bins costs no text rendering.
+    """
+
+    def __init__(
+        self,
+        edges,
+        y_range,
+        x_length=8,
+        y_length=2.5,
+        color=GOLD_A,
+        y_numbers=None,
+        label_size=15,
+        label_angle=45 * DEGREES,
+        y_font_size=18,
+        tick_style=None,
+        **kwargs,
+    ):
+        self.edges = np.asarray(edges, dtype=float)
+        self.midpoints = bin_midpoints(self.edges)
+        super().__init__(
+            x_range=[self.edges[0], self.edges[-1], self.edges[1] - self.edges[0]],
+            y_range=y_range,
+            x_length=x_length,
+            y_length=y_length,
+            axis_config={"color": color, "include_numbers": False},
+            tips=False,
+            **kwargs,
+        )
+        for tick in [*self.x_axis.get_tick_marks(), *self.y_axis.get_tick_marks()]:
+            tick.set_stroke(**(tick_style or {"width": 1, "opacity": 0.5}))
+
+        x_buff = self.x_axis.line_to_number_buff
+        self.bin_labels = bin_label_glyphs(self.edges, color, label_size, label_angle)
+        for label, point in zip(self.bin_labels, self.x_axis.n2p(self.midpoints)):
+            label.next_to(point, DOWN, buff=x_buff)
+
+        if y_numbers is None:
+            y_numbers = np.arange(y_range[0], y_range[1] + 1e-9, y_range[2])
+        y_buff = self.y_axis.line_to_number_buff
+        self.y_labels = VGroup(
+            *[
+                cached_text(f"{n:g}", color, font_size=y_font_size).next_to(
+                    self.y_axis.n2p(n), LEFT, buff=y_buff
+                )
+                for n in y_numbers
+            ]
+        )
+        # labels belong to their axis, like NumberLine's own numbers would
+        self.x_axis.add(self.bin_labels)
+        self.y_axis.add(self.y_labels)
+
+
+class FacetGrid(VGroup):
+    """One BinnedAxes per level of a grouping column, stacked and right-aligned.
+
+    All facets share the bin edges (and so the label glyphs), the midpoint
+    array and one ``vertical_step``. A sample goes to its facet by the
+    categorical code of its level, so placing N samples over any number of
+    facets is a single array lookup.
+    """
+
+    def __init__(self, levels, edges, y_range, buff=0.5, **axes_kwargs):
+        self.levels = list(levels)
+        super().__init__(
+            *[BinnedAxes(edges, y_range, **axes_kwargs) for _ in self.levels]
+        )
+        self.arrange(DOWN, buff=buff, aligned_edge=RIGHT)
+        self.edges = self.submobjects[0].edges
+        self.midpoints = self.submobjects[0].midpoints
+        first_y = self.submobjects[0].y_axis
+        self.vertical_step = (first_y.n2p(1) - first_y.n2p(0))[1]
+
+    def facet_codes(self, groups):
+        """Facet index of every group value, -1 for levels without a facet."""
+        return pd.Categorical(groups, categories=self.levels).codes
+
+    def bin_points(self, codes, values):
+        """(N, 3) points on facet ``codes[k]``'s x-axis at ``values[k]``.
+
+        Every x-axis is a straight line, so this interpolates between the
+        axis ends of each sample's facet; unknown facets give NaN.
+        """
+        codes = np.asarray(codes)
+        starts = np.array([ax.x_axis.get_start() for ax in self.submobjects])
+        ends = np.array([ax.x_axis.get_end() for ax in self.submobjects])
+        x_min, x_max = self.submobjects[0].x_axis.x_range[:2]
+        alphas = (np.asarray(values, dtype=float) - x_min) / (x_max - x_min)
+        points = starts[codes] + alphas[:, None] * (ends - starts)[codes]
+        points[codes < 0] = np.nan
+        return points
@@ -0,0 +1,193 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from DescriptiveStats import ci_margin
+
+# Bootstrap distributions and percentile intervals for the per-condition
+# stats blocks, permutation tests between conditions, and repeated sampling
+# from a pseudo-population. No manim dependency.
+
+# Statistics by name, each reducing a (resamples, n) matrix along axis 1.
+# Names (not callables) are passed around, so the work can go to other
+# processes.
+STATISTICS = {
+    "mean": np.mean,
+    "median": np.median,
+    "sd": lambda sample, axis: np.std(sample, axis=axis, ddof=1),
+}
+
+# Resamples per task: the unit of seeding, so the result does not depend on
+# how many workers share the tasks.
+TASK_RESAMPLES = 2000
+
+
+def _resample_task(values, statistics, n_resamples, seed, max_elements):
+    """Bootstrap distributions of one task, drawn chunk by chunk.
+
+    Each chunk is a (rows, n) index matrix with at most ``max_elements``
+    entries, so memory stays bounded however large n and the task are.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(values)
+    rows = max(1, max_elements // n)
+    out = np.empty((len(statistics), n_resamples))
+    for start in range(0, n_resamples, rows):
+        stop = min(start + rows, n_resamples)
+        sample = values[rng.integers(0, n, size=(stop - start, n))]
+        for i, name in enumerate(statistics):
+            out[i, start:stop] = STATISTICS[name](sample, axis=1)
+    return out
+
+
+def bootstrap(
+    values,
+    statistics=("mean", "median"),
+    n_resamples=10000,
+    seed=0,
+    workers=1,
+    max_elements=2**22,
+):
+    """Bootstrap distribution of every statistic, as a dict of arrays.
+
+    The resamples are split into tasks of TASK_RESAMPLES, each with its own
+    child of ``SeedSequence(seed)`` (``seed`` may be one already), so a seed
+    gives the same distributions for any number of ``workers``; with
+    ``workers > 1`` the tasks run in a process pool. NaN values are left out.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    statistics = list(statistics)
+    if len(values) == 0:
+        return {name: np.full(n_resamples, np.nan) for name in statistics}
+
+    sizes = [TASK_RESAMPLES] * (n_resamples // TASK_RESAMPLES)
+    if n_resamples % TASK_RESAMPLES:
+        sizes.append(n_resamples % TASK_RESAMPLES)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    seeds = seed.spawn(len(sizes))
+    tasks = [
+        (values, statistics, size, task_seed, max_elements)
+        for size, task_seed in zip(sizes, seeds)
+    ]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_resample_task, *zip(*tasks)))
+    else:
+        parts = [_resample_task(*task) for task in tasks]
+
+    distributions = np.concatenate(parts, axis=1)
+    return dict(zip(statistics, distributions))
+
+
+def bootstrap_ci(values, statistics=("mean", "median"), confidence=0.95, **kwargs):
+    """Percentile bootstrap interval (low, high) of every statistic, as a dict."""
+    tail = (1 - confidence) / 2 * 100
+    return {
+        name: tuple(float(v) for v in np.percentile(distribution, [tail, 100 - tail]))
+        for name, distribution in bootstrap(values, statistics, **kwargs).items()
+    }
+
+
+def grouped_bootstrap_ci(
+    values, groups, statistics=("mean", "median"), confidence=0.95, seed=0, **kwargs
+):
+    """``bootstrap_ci`` per level of ``groups`` (order of first appearance).
+
+    Every level gets its own child seed of ``seed``, so adding a level
+    leaves the intervals of the earlier ones unchanged.
+    """
+    values = np.asarray(values, dtype=float)
+    codes, levels = pd.factorize(np.asarray(groups), sort=False)
+    seeds = np.random.SeedSequence(seed).spawn(len(levels))
+    return {
+        level: bootstrap_ci(
+            values[codes == i], statistics, confidence, seed=seeds[i], **kwargs
+        )
+        for i, level in enumerate(levels)
+    }
+
+
+# Observed statistic, its null distribution and the two-sided p-value.
+PermutationTest = namedtuple("PermutationTest", ["observed", "null", "p_value"])
+
+
+def permutation_test(values, groups, n_permutations=10000, seed=0, max_elements=2**22):
+    """Permutation test of the mean difference between two groups.
+
+    The difference is first level minus second level (order of first
+    appearance). Every permutation shuffles the labels by sorting a row of
+    random keys: a block of rows is one ``argsort`` over a (rows, n) key
+    matrix, and the first n_a positions of each row form the relabelled
+    first group. The p-value counts permutations at least as extreme as
+    the observed difference, plus one (the observed labelling itself).
+    """
+    values = np.asarray(values, dtype=float)
+    codes, levels = pd.factorize(np.asarray(groups), sort=False)
+    if len(levels) != 2:
+        raise ValueError(f"need exactly two groups, got {len(levels)}")
+    keep = (codes >= 0) & ~np.isnan(values)
+    values, in_first = values[keep], codes[keep] == 0
+    n, n_first = len(values), int(in_first.sum())
+    total = values.sum()
+    observed = values[in_first].mean() - values[~in_first].mean()
+
+    rng = np.random.default_rng(seed)
+    rows = max(1, max_elements // n)
+    null = np.empty(n_permutations)
+    for start in range(0, n_permutations, rows):
+        stop = min(start + rows, n_permutations)
+        order = np.argsort(rng.random((stop - start, n)), axis=1)
+        first_sums = values[order[:, :n_first]].sum(axis=1)
+        other_sums = total - first_sums
+        null[start:stop] = first_sums / n_first - other_sums / (n - n_first)
+
+    extreme = np.count_nonzero(np.abs(null) >= abs(observed) - 1e-12)
+    p_value = (extreme + 1) / (n_permutations + 1)
+    return PermutationTest(float(observed), null, p_value)
+
+
+# Mean and t-based CI of every simulated sample, whether that CI covers the
+# population mean mu, and mu itself.
+SamplingRun = namedtuple("SamplingRun", ["means", "ci_low", "ci_high", "covers", "mu"])
+
+
+def sampling_chunks(
+    population, sample_size, n_samples, seed=0, confidence=0.95, max_elements=2**22
+):
+    """Yield (means, ci_low, ci_high) of the simulated samples, chunk by chunk.
+
+    Samples of ``sample_size`` are drawn with replacement from
+    ``population``. A chunk is one (rows, sample_size) matrix with at most
+    ``max_elements`` entries, reduced along axis 1 and then dropped, so only
+    three numbers per sample are ever kept.
+    """
+    population = np.asarray(population, dtype=float)
+    population = population[~np.isnan(population)]
+    rng = np.random.default_rng(seed)
+    rows = max(1, max_elements // sample_size)
+    for start in range(0, n_samples, rows):
+        stop = min(start + rows, n_samples)
+        picks = rng.integers(0, len(population), size=(stop - start, sample_size))
+        samples = population[picks]
+        means = samples.mean(axis=1)
+        margin = ci_margin(samples.std(axis=1, ddof=1), sample_size, confidence)
+        yield means, means - margin, means + margin
+
+
+def simulate_sampling(
+    population, sample_size, n_samples=10000, seed=0, confidence=0.95, **kwargs
+):
+    """All chunks of ``sampling_chunks`` joined into one SamplingRun."""
+    mu = float(np.nanmean(np.asarray(population, dtype=float)))
+    chunks = list(
+        sampling_chunks(population, sample_size, n_samples, seed, confidence, **kwargs)
+    )
+    if chunks:
+        means, ci_low, ci_high = (np.concatenate(parts) for parts in zip(*chunks))
+    else:
+        means = ci_low = ci_high = np.zeros(0)
+    return SamplingRun(means, ci_low, ci_high, (ci_low <= mu) & (mu <= ci_high), mu)
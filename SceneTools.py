@@ -0,0 +1,193 @@
+from contextlib import contextmanager
+
+import numpy as np
+from manim import Animation, Mobject, RendererType, Wait, config, linear
+
+# Scene helpers that change how a scene is rendered, not what it shows.
+
+
+class CoalescedPlays(Animation):
+    """Several play() calls rendered as one animation, frame for frame.
+
+    ``steps`` holds the compiled animations of each call, in order. Every
+    step gets exactly the frames its own play() would have written (a
+    static wait the frozen frames of ``freeze_current_frame``), and it
+    is started, finished and cleaned up the way Scene.play does it: its
+    mobjects are added to the scene when it starts (not when the segment
+    starts), removers leave when it ends, and the moving / static split of
+    the Cairo renderer is recomputed for it, so the frames are the same as
+    with separate plays, only written to one partial movie file.
+    """
+
+    def __init__(self, steps, scene, **kwargs):
+        self.steps = [list(step) for step in steps]
+        step = 1 / config.frame_rate
+        # scene + earlier steps' mobjects => decides which waits are static
+        mobjects = scene.get_mobject_family_members()
+        frames = []
+        for anims in self.steps:
+            run_time = max(a.run_time for a in anims)
+            if self.is_static_wait(anims, scene, mobjects):
+                # frozen frame => what freeze_current_frame writes for it
+                frames.append(int(run_time / step))
+            else:
+                # what get_time_progression gives its play()
+                frames.append(len(np.arange(0, run_time, step)))
+            for anim in anims:
+                mobjects += anim.mobject.get_family()
+        self.step_ends = np.cumsum(frames)
+        self.step_starts = self.step_ends - frames
+        # half a frame short => np.arange gives exactly the frames of all steps
+        run_time = (max(self.step_ends[-1], 1) - 0.5) * step
+        super().__init__(
+            Mobject(), run_time=run_time, rate_func=linear, introducer=True, **kwargs
+        )
+
+    @staticmethod
+    def is_static_wait(anims, scene, mobjects):
+        """Whether a play() of ``anims`` alone would be a frozen-frame wait.
+
+        Same test as Scene.should_update_mobjects: a lone Wait is static
+        unless the scene or one of ``mobjects`` has time-based updaters.
+        """
+        if len(anims) != 1 or not isinstance(anims[0], Wait):
+            return False
+        wait = anims[0]
+        if wait.is_static_wait is not None:
+            return wait.is_static_wait
+        return not (
+            scene.always_update_mobjects
+            or scene.updaters
+            or wait.stop_condition is not None
+            or any(mob.has_time_based_updater() for mob in mobjects)
+        )
+
+    def _setup_scene(self, scene):
+        # the steps add their own mobjects when they start
+        self.scene = scene
+
+    def begin(self):
+        self.active = -1
+
+    def start_step(self, index):
+        scene = self.scene
+        anims = self.steps[index]
+        scene.add_mobjects_from_animations(anims)
+        for anim in anims:
+            anim._setup_scene(scene)
+            anim.begin()
+        scene.moving_mobjects, scene.static_mobjects = (
+            scene.get_moving_and_static_mobjects(anims)
+        )
+        scene.renderer.save_static_frame_data(scene, scene.static_mobjects)
+        self.active = index
+
+    def finish_step(self):
+        scene = self.scene
+        for anim in self.steps[self.active]:
+            anim.finish()
+            anim.clean_up_from_scene(scene)
+        if not scene.renderer.skip_animations:
+            scene.update_mobjects(0)
+
+    def advance_to(self, frame):
+        """Finish every step that ends by ``frame`` and start the one it is in."""
+        if self.active < 0:
+            self.start_step(0)
+        last = len(self.steps) - 1
+        while self.active < last and frame >= self.step_ends[self.active]:
+            self.finish_step()
+            self.start_step(self.active + 1)
+
+    def update_mobjects(self, dt):
+        if self.active >= 0:
+            for anim in self.steps[self.active]:
+                anim.update_mobjects(dt)
+
+    def interpolate(self, alpha):
+        frame = alpha * self.run_time * config.frame_rate
+        self.advance_to(frame + 1e-6)
+        elapsed = max(0, frame - self.step_starts[self.active]) / config.frame_rate
+        for anim in self.steps[self.active]:
+            anim.interpolate(elapsed / anim.run_time)
+
+    def finish(self):
+        # when animations are skipped only the last frame is "rendered"
+        self.advance_to(self.step_ends[-1])
+        self.finish_step()
+
+
+class CoalescingScene:
+    """Scene mixin: ``with self.coalesce():`` renders its plays as one segment.
+
+    Inside the block, play() and wait() calls are only collected; at the end
+    of the block (or before an add() / remove(), which must not overtake
+    them) the collected run is played as one CoalescedPlays, so manim opens
+    one partial movie file for it instead of one per call. Timing and
+    frames stay those of the separate calls.
+
+    The animations are built when they are called but only play later, so
+    a block should only hold calls whose animations do not read state that
+    the earlier calls change, e.g. flights to precomputed positions. Waits
+    with a stop condition or a frozen frame are played on their own. Only
+    the Cairo renderer coalesces; with OpenGL the block changes nothing.
+    """
+
+    coalesced_calls = None
+
+    @contextmanager
+    def coalesce(self):
+        if self.coalesced_calls is not None or config.renderer != RendererType.CAIRO:
+            # a nested block joins the outer run
+            yield self
+            return
+        self.coalesced_calls = []
+        try:
+            yield self
+        except BaseException:
+            self.coalesced_calls = None
+            raise
+        self.flush_plays()
+        self.coalesced_calls = None
+
+    def flush_plays(self):
+        """Play the collected calls now, as one segment if there are several."""
+        calls = self.coalesced_calls
+        if not calls:
+            return
+        # collecting stops while playing => the scene's own add() calls go through
+        self.coalesced_calls = None
+        try:
+            if len(calls) == 1:
+                args, kwargs = calls[0]
+                super().play(*args, **kwargs)
+            else:
+                steps = [self.compile_animations(*a, **kw) for a, kw in calls]
+                super().play(CoalescedPlays(steps, self))
+        finally:
+            self.coalesced_calls = []
+
+    def play(self, *args, **kwargs):
+        if self.coalesced_calls is None:
+            return super().play(*args, **kwargs)
+        own_play = any(key.startswith("subcaption") for key in kwargs) or any(
+            isinstance(arg, Wait)
+            and (arg.stop_condition is not None or arg.is_static_wait)
+            for arg in args
+        )
+        if own_play:
+            self.flush_plays()
+            calls, self.coalesced_calls = self.coalesced_calls, None
+            try:
+                return super().play(*args, **kwargs)
+            finally:
+                self.coalesced_calls = calls
+        self.coalesced_calls.append((args, kwargs))
+
+    def add(self, *mobjects):
+        self.flush_plays()
+        return super().add(*mobjects)
+
+    def remove(self, *mobjects):
+        self.flush_plays()
+        return super().remove(*mobjects)
@@ -0,0 +1,414 @@
+import numpy as np
+import pandas as pd
+from manim import (
+    GOLD_A,
+    AnimationGroup,
+    Succession,
+    Transform,
+    ValueTracker,
+    VectorizedPoint,
+    VGroup,
+    VMobject,
+    Wait,
+    config,
+)
+
+from GlyphCache import cached_text
+from TablePreview import TablePreview
+
+
+def segments_to_points(starts, ends):
+    """Turn (k, 3) start and end arrays into the (4k, 3) Bezier points of k straight lines."""
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    delta = ends - starts
+    quads = np.stack(
+        [starts, starts + delta / 3, starts + 2 * delta / 3, ends],
+        axis=1,
+    )
+    return quads.reshape(-1, 3)
+
+
+def grid_points(column_widths, n_rows, row_height):
+    """Row rules followed by column rules of a table.
+
+    Row i of the table is centred on y = -i * row_height and the columns are
+    centred around x = 0, the same layout the scenes used for their cells.
+    """
+    xs = np.concatenate([[0.0], np.cumsum(column_widths)]) - sum(column_widths) / 2
+    ys = row_height / 2 - np.arange(n_rows + 1) * row_height
+    return rule_points(xs, ys)
+
+
+def rule_points(xs, ys):
+    """Grid points for column rules at ``xs`` and row rules at ``ys`` (top to bottom)."""
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    # horizontal rules => one per row boundary, spanning the full width
+    h_starts = np.column_stack([np.full_like(ys, xs[0]), ys, np.zeros_like(ys)])
+    h_ends = np.column_stack([np.full_like(ys, xs[-1]), ys, np.zeros_like(ys)])
+    # vertical rules => one per column boundary, spanning the full height
+    v_starts = np.column_stack([xs, np.full_like(xs, ys[0]), np.zeros_like(xs)])
+    v_ends = np.column_stack([xs, np.full_like(xs, ys[-1]), np.zeros_like(xs)])
+
+    return segments_to_points(
+        np.concatenate([h_starts, v_starts]), np.concatenate([h_ends, v_ends])
+    )
+
+
+def column_centers(column_widths):
+    return [
+        sum(column_widths[:j]) + column_widths[j] / 2 - sum(column_widths) / 2
+        for j in range(len(column_widths))
+    ]
+
+
+def condition_colors(
+    data, color_map, column="Conditie", header_color="#FFD700", default="Other"
+):
+    """Text color of every table row of ``data``, header first.
+
+    The condition column is mapped through ``color_map`` once as a column,
+    so a new condition only needs a new ``color_map`` entry. ``data`` may
+    also be a TablePreview; its ellipsis row gets the ``default`` color.
+    """
+    if isinstance(data, TablePreview):
+        values = pd.Series(data.display_column(column), dtype=object)
+    else:
+        values = data[column]
+    body = values.map(color_map).fillna(color_map.get(default, GOLD_A))
+    return np.concatenate([[header_color], body.to_numpy(dtype=object)])
+
+
+def cell_label(value, color, scale, center, **text_kwargs):
+    """Cached text for one cell; empty cells become a point at the cell centre."""
+    text = str(value)
+    if text == "":
+        return VectorizedPoint(center)
+    return cached_text(text, color, scale=scale, **text_kwargs).move_to(center)
+
+
+class TableGrid(VMobject):
+    """All cell borders of a table as a single mobject.
+
+    The rules are stored as one concatenated point array (row rules first,
+    then column rules), so building it costs O(rows + columns) and stroke
+    changes or ``Create`` touch one object instead of a Rectangle per cell.
+    """
+
+    def __init__(
+        self,
+        column_widths,
+        n_rows,
+        row_height=0.75,
+        color=GOLD_A,
+        stroke_opacity=0.4,
+        **kwargs,
+    ):
+        self.column_widths = list(column_widths)
+        self.n_rows = n_rows
+        self.row_height = row_height
+        super().__init__(color=color, stroke_opacity=stroke_opacity, **kwargs)
+
+    def generate_points(self):
+        self.set_points(grid_points(self.column_widths, self.n_rows, self.row_height))
+
+    def get_row_rule_y(self, k):
+        # row rule k starts at point 4k
+        return self.points[4 * k][1]
+
+    def get_column_rule_x(self, k):
+        # column rules come after the n_rows + 1 row rules
+        return self.points[4 * (self.n_rows + 1 + k)][0]
+
+    def get_row_rules_y(self):
+        return self.points[0 : 4 * (self.n_rows + 1) : 4, 1].copy()
+
+    def get_column_rules_x(self):
+        return self.points[4 * (self.n_rows + 1) :: 4, 0].copy()
+
+    def get_cell_center(self, i, j):
+        x = (self.get_column_rule_x(j) + self.get_column_rule_x(j + 1)) / 2
+        y = (self.get_row_rule_y(i) + self.get_row_rule_y(i + 1)) / 2
+        return np.array([x, y, self.points[0][2]])
+
+
+class DataTable(VGroup):
+    """A table of text cells drawn on top of one TableGrid.
+
+    ``rows`` holds the display values, header first. The labels are kept
+    row-major in ``self.labels`` and come from the shared glyph cache, so a
+    value that repeats down a column is only parsed once. Empty strings
+    become a VectorizedPoint at the cell centre so a later Transform grows
+    out of the right cell.
+    """
+
+    def __init__(
+        self,
+        rows,
+        column_widths,
+        row_height=0.75,
+        row_colors=None,
+        header_color="#FFD700",
+        header_scale=0.5,
+        header_weight="NORMAL",
+        text_scales=None,
+        grid_config=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.column_widths = list(column_widths)
+        self.row_height = row_height
+        self.n_rows = len(rows)
+        self.n_cols = len(self.column_widths)
+        self.columns = list(rows[0])
+        if text_scales is None:
+            text_scales = [0.5] * self.n_cols
+        if row_colors is None:
+            row_colors = [GOLD_A] * self.n_rows
+        if len(row_colors) != self.n_rows:
+            raise ValueError(f"got {len(row_colors)} row colors for {self.n_rows} rows")
+        # ManimColor supports indexing, so np.asarray would try to split it up
+        self.row_colors = np.array([str(c) for c in row_colors], dtype=object)
+
+        self.grid = TableGrid(
+            self.column_widths, self.n_rows, row_height, **(grid_config or {})
+        )
+
+        x_centers = column_centers(self.column_widths)
+        self.labels = VGroup()
+        for i, row in enumerate(rows):
+            for j, value in enumerate(row):
+                center = [x_centers[j], -i * row_height, 0]
+                if i == 0:
+                    label = cell_label(
+                        value, header_color, header_scale, center, weight=header_weight
+                    )
+                else:
+                    label = cell_label(value, None, text_scales[j], center)
+                self.labels.add(label)
+
+        # color the body in bulk => one set_color per distinct row color
+        body_colors = np.repeat(self.row_colors[1:], self.n_cols).astype(str)
+        body_labels = self.labels.submobjects[self.n_cols :]
+        for color in np.unique(body_colors):
+            members = np.flatnonzero(body_colors == color)
+            VGroup(*[body_labels[k] for k in members]).set_color(color)
+
+        self.add(self.grid, self.labels)
+
+    def get_label(self, i, j):
+        return self.labels[i * self.n_cols + j]
+
+    def get_cell_center(self, i, j):
+        return self.grid.get_cell_center(i, j)
+
+    def reveal_column(self, column, values, scale=0.4, cell_time=0.5, hold=0):
+        """One animation that fills ``column`` in, row by row.
+
+        ``values`` holds the new text for every body row (None skips a row).
+        Each cell is transformed in ``cell_time`` seconds and then held for
+        ``hold`` seconds (a number, or a function of the row index), the same
+        timing as a play()/wait() pair per row, but rendered as one segment.
+        """
+        j = column if isinstance(column, int) else self.columns.index(column)
+        steps = []
+        for i, value in enumerate(values, start=1):
+            if value is None:
+                continue
+            target = cell_label(
+                value, self.row_colors[i], scale, self.get_cell_center(i, j)
+            )
+            steps.append(Transform(self.get_label(i, j), target, run_time=cell_time))
+            pause = hold(i) if callable(hold) else hold
+            if pause > 0:
+                steps.append(Wait(pause))
+        return Succession(*steps, group=self)
+
+    def drop_column(self, column, **kwargs):
+        """Animation that removes ``column`` (header label or index) from the table.
+
+        The surviving labels are reused as they are: only the dropped column
+        fades out, and the columns to its right slide left so the table keeps
+        its left edge. The grid morphs with an unchanged point count (the
+        dropped column shrinks to zero width) and is tidied up afterwards.
+        """
+        j = column if isinstance(column, int) else self.columns.index(column)
+        xs = self.grid.get_column_rules_x()
+        ys = self.grid.get_row_rules_y()
+        scale = (xs[-1] - xs[0]) / sum(self.column_widths)
+
+        collapsed = list(self.column_widths)
+        collapsed[j] = 0
+        new_xs = xs[0] + scale * np.concatenate([[0.0], np.cumsum(collapsed)])
+
+        dropped = VGroup()
+        slides = []
+        for k in range(self.n_cols):
+            col_labels = [self.get_label(i, k) for i in range(self.n_rows)]
+            if k == j:
+                dropped.add(*col_labels)
+                continue
+            dx = (new_xs[k] + new_xs[k + 1] - xs[k] - xs[k + 1]) / 2
+            if dx != 0:
+                slides += [label.animate.shift([dx, 0, 0]) for label in col_labels]
+
+        # the dropped labels stay in the table (outside self.labels) until the fade is done
+        self.labels.remove(*dropped)
+        self.add(dropped)
+        del self.column_widths[j]
+        del self.columns[j]
+        self.n_cols -= 1
+
+        return DropColumn(
+            self,
+            dropped,
+            np.delete(new_xs, j + 1),
+            ys,
+            dropped.animate.set_opacity(0),
+            self.grid.animate.set_points(rule_points(new_xs, ys)),
+            *slides,
+            **kwargs,
+        )
+
+
+class DropColumn(AnimationGroup):
+    """AnimationGroup over a table that tidies up after a column drop.
+
+    Once played, the faded labels leave the table and the collapsed grid is
+    replaced by one without the zero-width column.
+    """
+
+    def __init__(self, table, dropped, final_xs, ys, *animations, **kwargs):
+        self.table = table
+        self.dropped = dropped
+        self.final_xs = final_xs
+        self.ys = ys
+        super().__init__(*animations, group=table, **kwargs)
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        self.table.remove(self.dropped)
+        self.table.grid.column_widths = list(self.table.column_widths)
+        self.table.grid.set_points(rule_points(self.final_xs, self.ys))
+
+
+class WindowedTable(VGroup):
+    """A scrolling table that only holds mobjects for the rows inside a window.
+
+    ``self.scroll`` is a ValueTracker with the distance the table has moved
+    up. An updater works out which rows overlap the window (the camera frame
+    by default) and keeps them in a ring of row slots: when a row leaves the
+    window, its slot is emptied and refilled with cached labels for the row
+    that enters it, so only the slot groups are reused. Build time and
+    per-frame cost depend on the window height, not on ``len(rows)``.
+
+    The table supports being shifted around; it does not support scaling.
+    """
+
+    def __init__(
+        self,
+        rows,
+        column_widths,
+        row_height=0.75,
+        top=None,
+        window=None,
+        row_colors=None,
+        header_color="#FFD700",
+        header_scale=0.5,
+        text_scales=None,
+        grid_config=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.rows = rows
+        self.column_widths = list(column_widths)
+        self.row_height = row_height
+        self.n_rows = len(rows)
+        self.n_cols = len(self.column_widths)
+        if row_colors is None:
+            row_colors = [GOLD_A] * self.n_rows
+        if text_scales is None:
+            text_scales = [0.5] * self.n_cols
+        # ManimColor supports indexing, so np.asarray would try to split it up
+        self.row_colors = np.array([str(c) for c in row_colors], dtype=object)
+        self.header_color = header_color
+        self.header_scale = header_scale
+        self.text_scales = text_scales
+        if top is None:
+            top = config.frame_height / 2 - 0.5
+        if window is None:
+            window = (-config.frame_height / 2, config.frame_height / 2)
+        self.window = window
+        self.x_centers = np.array(column_centers(self.column_widths))
+
+        self.scroll = ValueTracker(0)
+        # top-centre of the (virtual) full table; moves along with shift()
+        self.anchor = VectorizedPoint([0, top, 0])
+        self.n_slots = int(np.ceil((window[1] - window[0]) / row_height)) + 1
+        self.slots = VGroup(*[VGroup() for _ in range(self.n_slots)])
+        self.slot_rows = [-1] * self.n_slots
+        self.grid = TableGrid(
+            self.column_widths, self.n_slots, row_height, **(grid_config or {})
+        )
+        self._grid_points = {}
+
+        self.add(self.anchor, self.grid, self.slots)
+        self.add_updater(lambda m: m._update_window())
+        self._update_window()
+
+    def get_full_height(self):
+        return self.n_rows * self.row_height
+
+    def get_scroll_to_end(self, bottom_margin=0):
+        """Scroll value that puts the last row's bottom at the window bottom + margin."""
+        top = self.anchor.get_center()[1]
+        return self.window[0] + bottom_margin - top + self.get_full_height()
+
+    def get_visible_rows(self):
+        top = self.anchor.get_center()[1] + self.scroll.get_value()
+        h = self.row_height
+        first = max(0, int(np.floor((top - self.window[1]) / h)))
+        last = min(self.n_rows - 1, int(np.ceil((top - self.window[0]) / h)) - 1)
+        return first, last
+
+    def _row_labels(self, i):
+        if i == 0:
+            color, scales = self.header_color, [self.header_scale] * self.n_cols
+        else:
+            color, scales = self.row_colors[i], self.text_scales
+        return [
+            cell_label(value, color, scales[j], [self.x_centers[j], 0, 0])
+            for j, value in enumerate(self.rows[i])
+        ]
+
+    def _update_window(self):
+        anchor = self.anchor.get_center()
+        top = anchor[1] + self.scroll.get_value()
+        h = self.row_height
+        first, last = self.get_visible_rows()
+        visible = range(first, last + 1)
+        # ring buffer => row i always lives in slot i % n_slots
+        wanted = {i % self.n_slots: i for i in visible}
+
+        for slot_idx, slot in enumerate(self.slots):
+            row_idx = wanted.get(slot_idx, -1)
+            if row_idx != self.slot_rows[slot_idx]:
+                slot.remove(*slot.submobjects)
+                if row_idx >= 0:
+                    slot.add(*self._row_labels(row_idx))
+                self.slot_rows[slot_idx] = row_idx
+            if row_idx >= 0:
+                y = top - (row_idx + 0.5) * h
+                for label, x in zip(slot.submobjects, self.x_centers):
+                    label.move_to([anchor[0] + x, y, anchor[2]])
+
+        n_visible = len(visible)
+        if n_visible == 0:
+            self.grid.set_points(np.zeros((0, 3)))
+            return
+        if n_visible not in self._grid_points:
+            self._grid_points[n_visible] = grid_points(self.column_widths, n_visible, h)
+        self.grid.n_rows = n_visible
+        offset = [anchor[0], top - (first + 0.5) * h, anchor[2]]
+        self.grid.set_points(self._grid_points[n_visible] + offset)
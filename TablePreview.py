@@ -0,0 +1,75 @@
+class TablePreview:
+    """Head / ellipsis / tail view over a DataFrame.
+
+    Only the row ranges are recorded: ``head``, ``hidden`` and ``tail`` are
+    positional slices of the source frame, so nothing is copied and the
+    numeric columns keep their dtypes. The ellipsis marker only exists in the
+    display rows handed to a table, never in the data itself.
+
+    Table rows are counted the way DataTable counts them: row 0 is the
+    header, the head rows follow, then the ellipsis row (if any rows are
+    hidden), then the tail rows.
+    """
+
+    def __init__(self, data, head=5, tail=4, marker="..."):
+        self.data = data
+        self.marker = marker
+        n = len(data)
+        self.n_head = min(head, n)
+        self.n_tail = min(tail, n - self.n_head)
+        # source positions of the three parts
+        self.head_range = range(self.n_head)
+        self.hidden_range = range(self.n_head, n - self.n_tail)
+        self.tail_range = range(n - self.n_tail, n)
+
+    @property
+    def head(self):
+        return self.data.iloc[self.head_range.start : self.head_range.stop]
+
+    @property
+    def hidden(self):
+        return self.data.iloc[self.hidden_range.start : self.hidden_range.stop]
+
+    @property
+    def tail(self):
+        return self.data.iloc[self.tail_range.start : self.tail_range.stop]
+
+    @property
+    def has_ellipsis(self):
+        return len(self.hidden_range) > 0
+
+    @property
+    def ellipsis_row(self):
+        """Table row of the ellipsis marker, or None when no rows are hidden."""
+        return self.n_head + 1 if self.has_ellipsis else None
+
+    @property
+    def tail_start_row(self):
+        """Table row of the first tail row."""
+        return self.n_head + 1 + int(self.has_ellipsis)
+
+    @property
+    def n_display_rows(self):
+        """Number of table rows, header included."""
+        return self.tail_start_row + self.n_tail
+
+    def display_column(self, column, marker=...):
+        """Values of ``column`` in table order, with ``marker`` in the ellipsis row.
+
+        By default the preview's own marker is used; pass ``marker=None`` to
+        get None there instead (e.g. to skip that row when animating).
+        """
+        if marker is ...:
+            marker = self.marker
+        values = self.head[column].tolist()
+        if self.has_ellipsis:
+            values.append(marker)
+        return values + self.tail[column].tolist()
+
+    def display_rows(self, columns=None):
+        """Header plus one list per table row, ready for DataTable."""
+        columns = list(self.data.columns if columns is None else columns)
+        rows = [columns] + self.head[columns].values.tolist()
+        if self.has_ellipsis:
+            rows.append([self.marker] * len(columns))
+        return rows + self.tail[columns].values.tolist()